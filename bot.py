@@ -20,6 +20,7 @@ from discord.ext import commands
 
 from utils.env_config import validate_environment, configure_logging
 from utils.db import initialize_db, close_db_connection
+from utils.helpers import invalidate_bot_name, invalidate_perm_cache
 
 # Set up logging
 configure_logging()
@@ -78,9 +79,7 @@ async def on_ready():
         # Create task for auto-bounty system (runs every 5 minutes)
         if 'auto_bounty_task' not in bot.background_tasks:
             logger.info("Starting auto-bounty system background task...")
-            auto_bounty_task = asyncio.create_task(
-                AutoBountySystem.start_auto_bounty_task(bot, interval_minutes=5)
-            )
+            auto_bounty_task = AutoBountySystem.start_auto_bounty_task(bot, interval_minutes=5)
             bot.background_tasks['auto_bounty_task'] = auto_bounty_task
             logger.info("Auto-bounty system started successfully")
     except Exception as e:
@@ -126,6 +125,51 @@ async def on_guild_join(guild):
             "To get started, server admins can use `/server setup` to configure game server connections."
         )
 
+@bot.event
+async def on_guild_remove(guild):
+    """Called when the bot is removed from a guild."""
+    logger.info(f"Bot has been removed from guild: {guild.name} (ID: {guild.id})")
+    invalidate_bot_name(guild.id)
+    invalidate_perm_cache(guild.id)
+
+@bot.event
+async def on_guild_update(before, after):
+    """Called when a guild's settings (e.g. its owner) change."""
+    if before.owner_id != after.owner_id:
+        invalidate_perm_cache(after.id)
+
+def _invalidate_member_perms(member):
+    """Drop a member's cached permission checks
+    
+    Home guild admins are admins everywhere, so a change there drops the
+    member's entries in every guild.
+    """
+    if member.guild.id == getattr(bot, 'home_guild_id', None):
+        invalidate_perm_cache(None, member.id)
+    else:
+        invalidate_perm_cache(member.guild.id, member.id)
+
+@bot.event
+async def on_member_update(before, after):
+    """Called when a member's profile (e.g. nickname) changes."""
+    _invalidate_member_perms(after)
+    if bot.user and after.id == bot.user.id:
+        invalidate_bot_name(after.guild.id)
+
+@bot.event
+async def on_member_remove(member):
+    """Called when a member leaves or is removed from a guild."""
+    _invalidate_member_perms(member)
+
+@bot.event
+async def on_guild_role_update(before, after):
+    """Called when a role's name or permissions change."""
+    # Home guild roles decide admin access in every guild
+    if after.guild.id == getattr(bot, 'home_guild_id', None):
+        invalidate_perm_cache(None)
+    else:
+        invalidate_perm_cache(after.guild.id)
+
 @bot.event
 async def on_command_error(ctx, error):
     """Global error handler for traditional commands."""
@@ -306,6 +350,14 @@ if __name__ == "__main__":
     # Run the startup process
     logger.info("Tower of Temptation PvP Statistics Bot starting up...")
     
+    # Use uvloop's faster event loop for Discord and SFTP traffic when installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        pass
+    
     # Set up asyncio event loop
     loop = asyncio.get_event_loop()
     try:
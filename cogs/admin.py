@@ -11,6 +11,7 @@ from typing import Optional
 from models.guild import Guild
 from utils.embed_builder import EmbedBuilder
 from utils.helpers import is_home_guild_admin
+from utils.decorators import invalidate_role_cache
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +51,8 @@ class Admin(commands.Cog):
                 await self.bot.db.guilds.insert_one(guild.to_document())
             
             # Set admin role
-            await guild.set_admin_role(role.id)
+            await guild.set_admin_role(self.bot.db, role.id)
+            invalidate_role_cache(self.bot.db, str(ctx.guild.id))
             
             # Send success message
             embed = EmbedBuilder.create_success_embed(
@@ -10,6 +10,7 @@ import asyncio
 import logging
 import os
 import re
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union, Tuple
 
@@ -21,9 +22,17 @@ from utils.csv_parser import CSVParser
 from utils.sftp import SFTPManager
 from utils.embed_builder import EmbedBuilder
 from utils.helpers import has_admin_permission
+from utils.async_utils import semaphore_gather
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of servers whose CSV files are processed at the same time
+MAX_CONCURRENT_SERVERS = 8
+
+# Seconds a log directory's mtime must be in the past before a run may skip
+# listing it; covers the one-second mtime resolution plus minor clock skew
+DIR_MTIME_SETTLE_SECONDS = 2
+
 class CSVProcessorCog(commands.Cog):
     """Commands and background tasks for processing CSV files"""
     
@@ -40,20 +49,25 @@ class CSVProcessorCog(commands.Cog):
         self.processing_lock = asyncio.Lock()
         self.is_processing = False
         self.last_processed = {}  # Track last processed timestamp per server
+        self.dir_mtimes = {}  # Log directory mtime at the last complete run per server
         
         # Start background task
         self.process_csv_files_task.start()
     
-    def cog_unload(self):
+    async def cog_unload(self):
         """Stop background tasks and close connections when cog is unloaded"""
         self.process_csv_files_task.cancel()
         
-        # Close all SFTP connections
-        for server_id, sftp_manager in self.sftp_managers.items():
-            try:
-                asyncio.create_task(sftp_manager.disconnect())
-            except Exception as e:
-                logger.error(f"Error disconnecting SFTP for server {server_id}: {e}")
+        # Close all SFTP connections together from a snapshot of the pool
+        sftp_managers = list(self.sftp_managers.items())
+        self.sftp_managers.clear()
+        results = await asyncio.gather(
+            *(sftp_manager.disconnect() for _, sftp_manager in sftp_managers),
+            return_exceptions=True
+        )
+        for (server_id, _), result in zip(sftp_managers, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error disconnecting SFTP for server {server_id}: {result}")
     
     @tasks.loop(minutes=5.0)
     async def process_csv_files_task(self):
@@ -71,11 +85,19 @@ class CSVProcessorCog(commands.Cog):
             # Get list of configured servers
             server_configs = await self._get_server_configs()
             
-            for server_id, config in server_configs.items():
-                try:
-                    await self._process_server_csv_files(server_id, config)
-                except Exception as e:
-                    logger.error(f"Error processing CSV files for server {server_id}: {str(e)}")
+            # Drop SFTP clients for servers that are no longer configured
+            for server_id in [s for s in self.sftp_managers if s not in server_configs]:
+                await self.sftp_managers.pop(server_id).disconnect()
+            
+            # Each server has its own SFTP client, so servers are processed
+            # side by side rather than one connection at a time
+            results = await semaphore_gather(
+                asyncio.Semaphore(MAX_CONCURRENT_SERVERS),
+                [self._process_server_csv_files(server_id, config) for server_id, config in server_configs.items()]
+            )
+            for server_id, result in zip(server_configs, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error processing CSV files for server {server_id}: {str(result)}")
         
         except Exception as e:
             logger.error(f"Error in CSV processing task: {str(e)}")
@@ -148,19 +170,25 @@ class CSVProcessorCog(commands.Cog):
             await sftp.connect()
             
             try:
-                # List directory
+                # A new log file bumps its directory's mtime; if that has not
+                # changed since the last complete run, skip the listing
                 path = config["sftp_path"]
-                files = await sftp.list_directory(path)
+                dir_info = await sftp.get_file_info(path)
+                dir_mtime = dir_info["mtime"].timestamp() if dir_info else None
+                if dir_mtime is not None and self.dir_mtimes.get(server_id) == dir_mtime:
+                    logger.debug(f"No new CSV files for server {server_id}")
+                    return 0, 0
                 
-                # Filter for CSV files
-                csv_pattern = config.get("csv_pattern", r".*\.csv$")
-                csv_files = [f for f in files if re.match(csv_pattern, f)]
-                
-                # Sort chronologically
-                csv_files.sort()
+                # List directory
+                files = await sftp.list_directory(path)
                 
-                # Filter for files newer than last processed
-                new_files = [f for f in csv_files if f > last_time_str]
+                # CSV files newer than last processed, sorted chronologically;
+                # the cheap name comparison runs before the regex
+                csv_pattern = re.compile(config.get("csv_pattern", r".*\.csv$"))
+                new_files = sorted(
+                    f for f in files
+                    if f > last_time_str and csv_pattern.match(f)
+                )
                 
                 # Process each file
                 files_processed = 0
@@ -196,6 +224,18 @@ class CSVProcessorCog(commands.Cog):
                     except Exception as e:
                         logger.error(f"Error processing file {file}: {str(e)}")
                 
+                # Only remember the directory as seen once everything in it
+                # was processed, so failed files are retried next run. mtimes
+                # have whole-second resolution, so a file created in the same
+                # second after the listing would not change it; wait until the
+                # mtime is safely in the past before trusting it
+                if (
+                    files_processed == len(new_files)
+                    and dir_mtime is not None
+                    and time.time() - dir_mtime > DIR_MTIME_SETTLE_SECONDS
+                ):
+                    self.dir_mtimes[server_id] = dir_mtime
+                
                 return files_processed, events_processed
                 
             finally:
@@ -253,6 +293,7 @@ class CSVProcessorCog(commands.Cog):
         
         # Calculate lookback time
         self.last_processed[server_id] = datetime.now() - timedelta(hours=hours)
+        self.dir_mtimes.pop(server_id, None)
         
         # Process CSV files
         async with self.processing_lock:
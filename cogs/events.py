@@ -1264,7 +1264,8 @@ async def start_events_monitor(bot, guild_id: int, server_id: str):
                     voice_channel_id = int(str(voice_channel_id).strip())
             except (ValueError, TypeError) as e:
                 logger.error(f"Error converting voice_channel_id to int: {e}")
-                # Don't set to None - we'll fail gracefully when we try to use it
+                # Skip voice status updates rather than failing on every tick
+                voice_channel_id = None
 
         # Send initial notification to confirm monitor is running
         if channel_configured and events_channel:
@@ -1392,13 +1393,8 @@ async def start_events_monitor(bot, guild_id: int, server_id: str):
                         # Get current player count
                         player_count, _ = await server.get_online_player_count()
 
-                        # Ensure voice_channel_id is an integer
-                        if not isinstance(voice_channel_id, int):
-                            voice_channel_id = int(voice_channel_id)
-                            logger.info(f"Converted voice_channel_id to int: {voice_channel_id}")
-
-                        # Update voice channel
-                        await update_voice_channel_name(bot, guild_id, voice_channel_id, player_count)
+                        # Update voice channel (ID was converted to int before the loop)
+                        await update_voice_channel_name(bot, guild_id, voice_channel_id, f"Players Online: {player_count}")
                     except Exception as voice_e:
                         logger.warning(f"Error updating voice channel: {voice_e}")
 
@@ -2,6 +2,7 @@
 Premium features and management commands
 """
 import logging
+import types
 import discord
 from discord.ext import commands
 from discord import app_commands
@@ -14,6 +15,24 @@ from config import PREMIUM_TIERS, EMBED_THEMES
 
 logger = logging.getLogger(__name__)
 
+# Display names of the features listed in PREMIUM_TIERS, in display order
+FEATURE_DISPLAY = {
+    "killfeed": "Killfeed",
+    "events": "Events & Missions",
+    "connections": "Player Connections",
+    "stats": "Statistics & Leaderboards",
+    "custom_embeds": "Custom Embeds"
+}
+
+# Feature names of each tier as sets, for membership checks
+TIER_FEATURES = {
+    tier: frozenset(info.get("features", ()))
+    for tier, info in PREMIUM_TIERS.items()
+}
+
+# Shared read-only fallback for unknown tiers
+_EMPTY_TIER = types.MappingProxyType({})
+
 class Premium(commands.Cog):
     """Premium features and management commands"""
     
@@ -61,7 +80,7 @@ class Premium(commands.Cog):
                 guild=guild)
             
             # Add tier information
-            tier_info = PREMIUM_TIERS.get(guild.premium_tier, {})
+            tier_info = PREMIUM_TIERS.get(guild.premium_tier) or _EMPTY_TIER
             
             # Server slots
             max_servers = tier_info.get("max_servers", 1)
@@ -74,17 +93,9 @@ class Premium(commands.Cog):
             )
             
             # Features
-            features = tier_info.get("features", [])
-            feature_display = {
-                "killfeed": "Killfeed",
-                "events": "Events & Missions",
-                "connections": "Player Connections",
-                "stats": "Statistics & Leaderboards",
-                "custom_embeds": "Custom Embeds"
-            }
-            
+            features = TIER_FEATURES.get(guild.premium_tier, frozenset())
             feature_list = []
-            for feature, display_name in feature_display.items():
+            for feature, display_name in FEATURE_DISPLAY.items():
                 if feature in features:
                     feature_list.append(f"✅ {display_name}")
                 else:
@@ -250,19 +261,11 @@ class Premium(commands.Cog):
             # Add tier information
             for tier, info in PREMIUM_TIERS.items():
                 # Format features
-                features = info.get("features", [])
+                features = TIER_FEATURES[tier]
                 max_servers = info.get("max_servers", 0)
                 
-                feature_display = {
-                    "killfeed": "Killfeed",
-                    "events": "Events & Missions",
-                    "connections": "Player Connections",
-                    "stats": "Statistics & Leaderboards",
-                    "custom_embeds": "Custom Embeds"
-                }
-                
                 feature_list = []
-                for feature, display_name in feature_display.items():
+                for feature, display_name in FEATURE_DISPLAY.items():
                     if feature in features:
                         feature_list.append(f"✅ {display_name}")
                     else:
@@ -398,18 +401,11 @@ class Premium(commands.Cog):
                             guild=guild)
                         
                         # Add features info
-                        features = PREMIUM_TIERS.get(tier, {}).get("features", [])
-                        max_servers = PREMIUM_TIERS.get(tier, {}).get("max_servers", 0)
-                        
-                        feature_display = {
-                            "killfeed": "Killfeed",
-                            "events": "Events & Missions",
-                            "connections": "Player Connections",
-                            "stats": "Statistics & Leaderboards",
-                            "custom_embeds": "Custom Embeds"
-                        }
+                        tier_info = PREMIUM_TIERS.get(tier) or _EMPTY_TIER
+                        features = tier_info.get("features", ())
+                        max_servers = tier_info.get("max_servers", 0)
                         
-                        feature_list = [f"✅ {feature_display[f]}" for f in features if f in feature_display]
+                        feature_list = [f"✅ {FEATURE_DISPLAY[f]}" for f in features if f in FEATURE_DISPLAY]
                         
                         notify_embed.add_field(
                             name="Available Features",
@@ -248,6 +248,32 @@ async def server_id_autocomplete(interaction: discord.Interaction, current: str)
 
 logger = logging.getLogger(__name__)
 
+class RemoveServerConfirmView(discord.ui.View):
+    """Confirm/Cancel buttons for server removal, usable only by the command author"""
+
+    def __init__(self, author_id: int, timeout=60):
+        super().__init__(timeout=timeout)
+        self.author_id = author_id
+        self.value = None
+
+    @discord.ui.button(label="Confirm", style=discord.ButtonStyle.danger)
+    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message("You cannot use this button.", ephemeral=True)
+            return
+        self.value = True
+        self.stop()
+        await interaction.response.defer()
+
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.secondary)
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message("You cannot use this button.", ephemeral=True)
+            return
+        self.value = False
+        self.stop()
+        await interaction.response.defer()
+
 class Setup(commands.Cog):
     """Setup commands for configuring servers and channels"""
 
@@ -559,32 +585,8 @@ class Setup(commands.Cog):
                 "⚠️ This action CANNOT be undone and ALL statistics will be permanently lost! ⚠️"
             )
 
-            # Create confirmation buttons
-            class ConfirmView(discord.ui.View):
-                def __init__(self, timeout=60):
-                    super().__init__(timeout=timeout)
-                    self.value = None
-
-                @discord.ui.button(label="Confirm", style=discord.ButtonStyle.danger)
-                async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
-                    if interaction.user.id != ctx.author.id:
-                        await interaction.response.send_message("You cannot use this button.", ephemeral=True)
-                        return
-                    self.value = True
-                    self.stop()
-                    await interaction.response.defer()
-
-                @discord.ui.button(label="Cancel", style=discord.ButtonStyle.secondary)
-                async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
-                    if interaction.user.id != ctx.author.id:
-                        await interaction.response.send_message("You cannot use this button.", ephemeral=True)
-                        return
-                    self.value = False
-                    self.stop()
-                    await interaction.response.defer()
-
             # Send confirmation message
-            view = ConfirmView()
+            view = RemoveServerConfirmView(ctx.author.id)
             message = await ctx.send(embed=embed, view=view)
 
             # Wait for confirmation
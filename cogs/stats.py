@@ -14,7 +14,7 @@ from models.player import Player
 from models.guild import Guild
 from utils.embed_builder import EmbedBuilder
 from config import EMBED_COLOR, EMBED_FOOTER
-from utils.helpers import paginate_embeds, format_time_ago
+from utils.helpers import paginate_embeds, format_time_ago, format_relative_timestamp
 
 logger = logging.getLogger(__name__)
 
@@ -905,7 +905,7 @@ class Stats(commands.Cog):
             recent_events = server_stats.get("recent_events", [])
             if recent_events:
                 event_str = "\n".join([
-                    f"{event['event_type']}: {format_time_ago(event['timestamp'])}"
+                    f"{event['event_type']}: {format_relative_timestamp(event['timestamp'])}"
                     for event in recent_events[:3]
                 ])
                 embed.add_field(name="Recent Events", value=event_str, inline=False)
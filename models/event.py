@@ -46,7 +46,7 @@ class Event:
             event_data["timestamp"] = datetime.fromisoformat(event_data["timestamp"])
         
         # Set created timestamp
-        event_data["created_at"] = datetime.utcnow().isoformat()
+        event_data["created_at"] = datetime.utcnow()
         
         # Insert event
         result = await db.events.insert_one(event_data)
@@ -150,7 +150,7 @@ class Connection:
                 raise ValueError(f"Missing required field: {field}")
         
         # Set created timestamp
-        connection_data["created_at"] = datetime.utcnow().isoformat()
+        connection_data["created_at"] = datetime.utcnow()
         
         # Insert connection
         result = await db.connections.insert_one(connection_data)
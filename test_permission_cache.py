@@ -0,0 +1,119 @@
+"""
+Test the short-lived permission check cache in utils.helpers.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from utils import helpers
+from utils.helpers import _cached_permission, invalidate_perm_cache
+
+
+def _ctx(guild_id, user_id, role_ids=()):
+    """Build a command context for a member with the given role IDs"""
+    ctx = MagicMock()
+    ctx.guild.id = guild_id
+    ctx.author.id = user_id
+    ctx.author.roles = _roles(role_ids)
+    return ctx
+
+
+def _roles(role_ids):
+    """Build role objects with the given IDs"""
+    return [MagicMock(id=role_id) for role_id in role_ids]
+
+
+class TestPermissionCache(unittest.TestCase):
+    """Test when cached permission checks are reused and rechecked"""
+
+    def setUp(self):
+        """Start every test with an empty cache and a counting check."""
+        helpers._perm_cache.clear()
+        self.addCleanup(helpers._perm_cache.clear)
+        self.check = MagicMock(return_value=True)
+
+    def test_repeat_check_is_cached(self):
+        """Test that a second check for the same member is served from the cache."""
+        ctx = _ctx(1, 10, [100])
+
+        self.assertTrue(_cached_permission("admin", ctx, self.check))
+        self.assertTrue(_cached_permission("admin", ctx, self.check))
+        self.assertEqual(self.check.call_count, 1)
+
+    def test_role_change_forces_recheck(self):
+        """Test that a change in the member's roles bypasses the cached result."""
+        ctx = _ctx(1, 10, [100])
+        _cached_permission("admin", ctx, self.check)
+
+        ctx.author.roles = _roles([100, 200])
+        self.check.return_value = False
+
+        self.assertFalse(_cached_permission("admin", ctx, self.check))
+        self.assertEqual(self.check.call_count, 2)
+
+    def test_invalidate_forces_recheck(self):
+        """Test that invalidate_perm_cache drops a member's or a whole guild's entries."""
+        ctx = _ctx(1, 10)
+        other = _ctx(1, 11)
+        _cached_permission("admin", ctx, self.check)
+        _cached_permission("mod", other, self.check)
+
+        invalidate_perm_cache(1, 10)
+        _cached_permission("admin", ctx, self.check)
+        _cached_permission("mod", other, self.check)
+        self.assertEqual(self.check.call_count, 3)
+
+        invalidate_perm_cache(1)
+        _cached_permission("admin", ctx, self.check)
+        _cached_permission("mod", other, self.check)
+        self.assertEqual(self.check.call_count, 5)
+
+    def test_invalidate_user_in_every_guild(self):
+        """Test that invalidating without a guild drops the user's entries everywhere."""
+        home, other, bystander = _ctx(1, 10), _ctx(2, 10), _ctx(2, 11)
+        for ctx in (home, other, bystander):
+            _cached_permission("admin", ctx, self.check)
+
+        invalidate_perm_cache(None, 10)
+        self.assertEqual(set(helpers._perm_cache), {(2, 11, "admin")})
+
+        invalidate_perm_cache(None)
+        self.assertEqual(len(helpers._perm_cache), 0)
+
+    def test_ttl_expires_entries(self):
+        """Test that entries older than the TTL are rechecked."""
+        ctx = _ctx(1, 10)
+
+        with patch("utils.helpers.time.monotonic", return_value=1000.0):
+            _cached_permission("admin", ctx, self.check)
+        with patch("utils.helpers.time.monotonic", return_value=1000.0 + helpers._PERM_CACHE_TTL - 1):
+            _cached_permission("admin", ctx, self.check)
+        self.assertEqual(self.check.call_count, 1)
+
+        with patch("utils.helpers.time.monotonic", return_value=1000.0 + helpers._PERM_CACHE_TTL):
+            _cached_permission("admin", ctx, self.check)
+        self.assertEqual(self.check.call_count, 2)
+
+    def test_lru_bound_evicts_oldest(self):
+        """Test that the cache stays bounded and evicts the least recently used entry."""
+        first, second, third = _ctx(1, 10), _ctx(1, 11), _ctx(1, 12)
+
+        with patch("utils.helpers._PERM_CACHE_SIZE", 2):
+            _cached_permission("admin", first, self.check)
+            _cached_permission("admin", second, self.check)
+            # Touch the first entry so the second becomes the oldest
+            _cached_permission("admin", first, self.check)
+            _cached_permission("admin", third, self.check)
+
+            self.assertEqual(len(helpers._perm_cache), 2)
+            self.assertNotIn((1, 11, "admin"), helpers._perm_cache)
+
+            self.check.reset_mock()
+            _cached_permission("admin", first, self.check)
+            self.assertEqual(self.check.call_count, 0)
+            _cached_permission("admin", second, self.check)
+            self.assertEqual(self.check.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Test the spacing and cancellation behaviour of RateLimiter.
+"""
+
+import unittest
+import asyncio
+from unittest.mock import patch
+
+from utils.async_utils import RateLimiter
+
+# Kept for yielding to the event loop while asyncio.sleep is patched
+_real_sleep = asyncio.sleep
+
+
+class FakeClock:
+    """Frozen clock whose sleep records the delay and blocks until cancelled"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.waits = []
+
+    def time(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.waits.append(delay)
+        await asyncio.Event().wait()
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test RateLimiter.acquire"""
+
+    def setUp(self):
+        """Freeze time and record the waits acquire asks for."""
+        self.clock = FakeClock()
+        for target, fake in (("time.time", self.clock.time), ("asyncio.sleep", self.clock.sleep)):
+            patcher = patch(target, fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _waits(self, limiter, count):
+        """Start count concurrent acquires and return how many proceed and the waits of the rest."""
+        async def run():
+            tasks = [asyncio.create_task(limiter.acquire()) for _ in range(count)]
+            await _real_sleep(0)
+            done = sum(task.done() for task in tasks)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            return done, list(self.clock.waits)
+
+        return asyncio.run(run())
+
+    def test_burst_then_wait_for_period(self):
+        """Test that calls beyond the limit wait until a period after the earlier calls."""
+        done, waits = self._waits(RateLimiter(2, 0.2, spread=False), 4)
+
+        self.assertEqual(done, 2)
+        self.assertEqual(len(waits), 2)
+        for wait in waits:
+            self.assertAlmostEqual(wait, 0.2)
+
+    def test_spread_spaces_calls_evenly(self):
+        """Test that spread mode keeps waiting calls period / calls apart."""
+        done, waits = self._waits(RateLimiter(2, 0.2), 5)
+
+        self.assertEqual(done, 2)
+        for wait, expected in zip(waits, [0.2, 0.3, 0.4]):
+            self.assertAlmostEqual(wait, expected)
+
+    def test_cancelled_waiter_releases_slot(self):
+        """Test that cancelling a waiting caller frees its slot for the next one."""
+        limiter = RateLimiter(1, 0.2, spread=False)
+
+        async def run():
+            await limiter.acquire()
+
+            waiter = asyncio.create_task(limiter.acquire())
+            await _real_sleep(0)
+            self.assertEqual(len(limiter.timestamps), 2)
+
+            waiter.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await waiter
+            self.assertEqual(len(limiter.timestamps), 1)
+
+            # The next caller takes the freed slot instead of queueing behind it
+            follower = asyncio.create_task(limiter.acquire())
+            await _real_sleep(0)
+            follower.cancel()
+            await asyncio.gather(follower, return_exceptions=True)
+
+        asyncio.run(run())
+        self.assertEqual(len(self.clock.waits), 2)
+        self.assertAlmostEqual(self.clock.waits[1], 0.2)
+
+
+if __name__ == "__main__":
+    unittest.main()
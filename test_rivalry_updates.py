@@ -0,0 +1,118 @@
+"""
+Test that rivalry updates only write the player fields that changed.
+"""
+
+import copy
+import unittest
+import asyncio
+
+from utils.rivalry_tracker import RivalryTracker
+
+
+class MockPlayers:
+    """Mock players collection that honours projections and records writes"""
+
+    def __init__(self, docs):
+        self.docs = {doc["player_id"]: doc for doc in docs}
+        self.projections = []
+        self.sets = []
+
+    async def find_one(self, query, projection=None):
+        self.projections.append(projection)
+        doc = self.docs.get(query["player_id"])
+        if doc is None:
+            return None
+        if projection is None:
+            return copy.deepcopy(doc)
+
+        result = {"_id": doc["_id"]}
+        for field in projection:
+            top, _, sub = field.partition(".")
+            if top not in doc:
+                continue
+            if not sub:
+                result[top] = copy.deepcopy(doc[top])
+            elif sub in doc[top]:
+                result.setdefault(top, {})[sub] = copy.deepcopy(doc[top][sub])
+        return result
+
+    async def bulk_write(self, operations, ordered=True):
+        for operation in operations:
+            changes = operation._doc["$set"]
+            self.sets.append((operation._filter["player_id"], changes))
+            doc = self.docs[operation._filter["player_id"]]
+            for key, value in changes.items():
+                top, _, sub = key.partition(".")
+                if sub:
+                    doc.setdefault(top, {})[sub] = value
+                else:
+                    doc[top] = value
+
+
+class MockDB:
+    """Mock database with a players collection"""
+
+    def __init__(self, docs):
+        self.players = MockPlayers(docs)
+
+
+def _player(doc_id, player_id, name):
+    return {"_id": doc_id, "server_id": "server1", "player_id": player_id, "name": name}
+
+
+class TestRivalryUpdates(unittest.TestCase):
+    """Test the fields written by RivalryTracker.update_rivalry_on_kill"""
+
+    def setUp(self):
+        """Set up three players on one server."""
+        self.db = MockDB([
+            _player(1, "killer", "Killer"),
+            _player(2, "victim1", "Victim One"),
+            _player(3, "victim2", "Victim Two"),
+        ])
+
+    def _kill(self, killer_id, victim_id):
+        self.db.players.sets.clear()
+        kill = {"killer_id": killer_id, "victim_id": victim_id, "server_id": "server1"}
+        self.assertTrue(asyncio.run(RivalryTracker.update_rivalry_on_kill(self.db, kill)))
+        return dict(self.db.players.sets)
+
+    def test_first_kill_sets_top_fields(self):
+        """Test that the first kill writes the prey/nemesis entries and the top fields."""
+        sets = self._kill("killer", "victim1")
+
+        self.assertEqual(set(sets["killer"]), {"prey.victim1", "top_prey"})
+        self.assertEqual(set(sets["victim1"]), {"nemesis.killer", "top_nemesis"})
+
+    def test_kill_keeping_top_prey_only_sets_prey_entry(self):
+        """Test that a repeat kill that leaves the top prey unchanged writes only prey.<id>."""
+        for _ in range(3):
+            self._kill("killer", "victim1")
+        self._kill("killer", "victim2")
+
+        # victim1 stays the top prey with 3 kills, so top_prey is not rewritten
+        sets = self._kill("killer", "victim2")
+
+        self.assertEqual(set(sets["killer"]), {"prey.victim2"})
+        self.assertEqual(sets["killer"]["prey.victim2"]["kills"], 2)
+        self.assertEqual(self.db.players.docs["killer"]["top_prey"]["player_id"], "victim1")
+
+    def test_kill_on_top_prey_updates_top_prey_count(self):
+        """Test that killing the top prey again refreshes its kill count."""
+        self._kill("killer", "victim1")
+        sets = self._kill("killer", "victim1")
+
+        self.assertEqual(set(sets["killer"]), {"prey.victim1", "top_prey"})
+        self.assertEqual(sets["killer"]["top_prey"]["kills"], 2)
+
+    def test_projections_include_top_fields(self):
+        """Test that the player reads fetch the top fields they compare against."""
+        self._kill("killer", "victim1")
+
+        fields = set().union(*(p for p in self.db.players.projections if p))
+        self.assertIn("top_prey", fields)
+        self.assertIn("top_nemesis", fields)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,7 @@ This module provides:
 4. Semaphore-based concurrency control
 """
 import asyncio
+import bisect
 import inspect
 import logging
 import time
@@ -43,16 +44,22 @@ class AsyncCache:
             func_name = func.__qualname__
             if func_name not in cls._cache:
                 cls._cache[func_name] = {}
+            
+            max_age = timedelta(seconds=ttl)
+            last_sweep = datetime.utcnow()
                 
             @functools.wraps(func)
             async def wrapper(*args, **kwargs):
+                nonlocal last_sweep
+                
                 # Create cache key from arguments
                 cache_key = cls._create_cache_key(args, kwargs)
                 
-                # Check cache
-                if cache_key in cls._cache[func_name]:
-                    result, timestamp = cls._cache[func_name][cache_key]
-                    if datetime.utcnow() - timestamp < timedelta(seconds=ttl):
+                # Check cache (clear() may have dropped this function's dict)
+                cache = cls._cache.setdefault(func_name, {})
+                if cache_key in cache:
+                    result, timestamp = cache[cache_key]
+                    if datetime.utcnow() - timestamp < max_age:
                         # Cache hit
                         return result
                 
@@ -60,7 +67,16 @@ class AsyncCache:
                 result = await func(*args, **kwargs)
                 
                 # Store result in cache
-                cls._cache[func_name][cache_key] = (result, datetime.utcnow())
+                now = datetime.utcnow()
+                cache = cls._cache.setdefault(func_name, {})
+                cache[cache_key] = (result, now)
+                
+                # Drop expired entries at most once per TTL so keys that are
+                # never requested again do not accumulate
+                if now - last_sweep >= max_age:
+                    last_sweep = now
+                    for key in [k for k, (_, ts) in cache.items() if now - ts >= max_age]:
+                        del cache[key]
                 
                 return result
                 
@@ -215,34 +231,35 @@ class RateLimiter:
         
         This method will block until rate limit allows execution
         """
+        # Reserve a slot under the lock, then wait for it outside the lock so
+        # callers queue on their own reservations instead of on each other
         async with self.lock:
             now = time.time()
             
-            # Remove timestamps older than period
+            # Remove timestamps older than period (reserved future slots stay)
             self.timestamps = [ts for ts in self.timestamps if now - ts < self.period]
             
+            slot = now
             if len(self.timestamps) >= self.calls:
-                # Rate limit exceeded, wait for next slot
-                oldest = min(self.timestamps)
-                wait_time = self.period - (now - oldest)
+                # Rate limit exceeded, take the next free slot
+                slot = self.timestamps[-self.calls] + self.period
                 
-                if self.spread and self.timestamps:
+                if self.spread:
                     # Spread calls evenly
-                    wait_time = max(wait_time, self.period / self.calls)
-                    
-                if wait_time > 0:
-                    logger.debug(f"Rate limit exceeded, waiting {wait_time:.2f}s")
-                    # Release lock while waiting
-                    self.lock.release()
-                    await asyncio.sleep(wait_time)
-                    await self.lock.acquire()
+                    slot = max(slot, self.timestamps[-1] + self.period / self.calls)
                     
-                    # Recalculate after waiting
-                    now = time.time()
-                    self.timestamps = [ts for ts in self.timestamps if now - ts < self.period]
-            
-            # Add current timestamp
-            self.timestamps.append(now)
+            bisect.insort(self.timestamps, slot)
+        
+        wait_time = slot - now
+        if wait_time > 0:
+            logger.debug(f"Rate limit exceeded, waiting {wait_time:.2f}s")
+            try:
+                await asyncio.sleep(wait_time)
+            except asyncio.CancelledError:
+                # Give the reserved slot back so later callers can use it
+                if slot in self.timestamps:
+                    self.timestamps.remove(slot)
+                raise
 
 def retryable(max_retries: int = 3, delay: float = 2.0, backoff: float = 1.5, 
               exceptions: Union[type, List[type]] = Exception):
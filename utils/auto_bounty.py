@@ -12,6 +12,10 @@ import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 
+from discord.ext import tasks
+
+from utils.async_utils import semaphore_gather
+
 logger = logging.getLogger(__name__)
 
 class AutoBountySystem:
@@ -20,6 +24,9 @@ class AutoBountySystem:
     # Bounty source identifier
     SOURCE_AUTO = "auto"
     
+    # Maximum number of servers processed at the same time
+    MAX_CONCURRENT_SERVERS = 8
+    
     # Reason templates for auto-bounties
     REASON_KILLSTREAK = "AI Bounty: On a {streak_count} kill streak!"
     REASON_TARGET_FIXATION = "AI Bounty: Hunting {victim_name} ({kill_count} kills)"
@@ -51,43 +58,40 @@ class AutoBountySystem:
             end_time = datetime.utcnow()
             start_time = end_time - timedelta(minutes=minutes)
             
-            # Get recent kills within time window
-            cursor = db.kills.find({
-                "server_id": server_id,
-                "guild_id": guild_id,
-                "timestamp": {"$gte": start_time, "$lte": end_time},
-                "is_suicide": {"$ne": True}  # Exclude suicides
-            })
-            
-            # Group kills by killer
-            killer_stats = {}
-            async for kill in cursor:
-                killer_id = kill["killer_id"]
-                victim_id = kill["victim_id"]
-                
-                # Initialize killer stats if not exists
-                if killer_id not in killer_stats:
-                    killer_stats[killer_id] = {
-                        "kills": 0,
-                        "victims": {},
-                        "killer_name": kill["killer_name"]
-                    }
-                
-                # Update total kills
-                killer_stats[killer_id]["kills"] += 1
-                
-                # Update victim-specific kills
-                if victim_id not in killer_stats[killer_id]["victims"]:
-                    killer_stats[killer_id]["victims"][victim_id] = {
-                        "count": 0,
-                        "name": kill["victim_name"]
-                    }
-                killer_stats[killer_id]["victims"][victim_id]["count"] += 1
+            # Count recent kills per killer and victim in the database so
+            # only the per-killer totals come back, not every kill
+            pipeline = [
+                {"$match": {
+                    "server_id": server_id,
+                    "guild_id": guild_id,
+                    "timestamp": {"$gte": start_time, "$lte": end_time},
+                    "is_suicide": {"$ne": True}  # Exclude suicides
+                }},
+                {"$group": {
+                    "_id": {"killer_id": "$killer_id", "victim_id": "$victim_id"},
+                    "count": {"$sum": 1},
+                    "killer_name": {"$first": "$killer_name"},
+                    "victim_name": {"$first": "$victim_name"}
+                }},
+                {"$group": {
+                    "_id": "$_id.killer_id",
+                    "kills": {"$sum": "$count"},
+                    "killer_name": {"$first": "$killer_name"},
+                    "victims": {"$push": {
+                        "victim_id": "$_id.victim_id",
+                        "name": "$victim_name",
+                        "count": "$count"
+                    }}
+                }}
+            ]
+            killer_stats = await db.kills.aggregate(pipeline).to_list(length=None)
             
             # Check for killstreaks and target fixation
             bounties_to_create = []
             
-            for killer_id, stats in killer_stats.items():
+            for stats in killer_stats:
+                killer_id = stats["_id"]
+                
                 # Check for killstreak
                 if stats["kills"] >= kill_threshold:
                     # Create killstreak bounty data
@@ -107,7 +111,8 @@ class AutoBountySystem:
                     bounties_to_create.append(bounty_data)
                 
                 # Check for target fixation
-                for victim_id, victim_data in stats["victims"].items():
+                for victim_data in stats["victims"]:
+                    victim_id = victim_data["victim_id"]
                     if victim_data["count"] >= repeat_threshold:
                         bounty_data = {
                             "guild_id": guild_id,
@@ -404,21 +409,18 @@ class AutoBountySystem:
             bot: Discord bot instance
         """
         try:
-            # Get all guilds with premium features
-            premium_guilds = await bot.db.guilds.find({
-                "premium_tier": {"$gte": 2}  # Tier 2 or higher
-            }).to_list(None)
+            # Get all guilds with premium features and auto-bounty enabled,
+            # streamed with only the fields used here
+            premium_guilds = bot.db.guilds.find({
+                "premium_tier": {"$gte": 2},  # Tier 2 or higher
+                "features.auto_bounty": True
+            }, {"_id": 0, "guild_id": 1, "auto_bounty_settings": 1})
             
-            total_created = 0
-            total_skipped = 0
+            jobs = []
             
-            for guild_data in premium_guilds:
+            async for guild_data in premium_guilds:
                 guild_id = guild_data["guild_id"]
                 
-                # Check if auto-bounty feature is enabled for this guild
-                if not guild_data.get("features", {}).get("auto_bounty", False):
-                    continue
-                
                 # Get settings
                 settings = guild_data.get("auto_bounty_settings", {})
                 minutes = settings.get("minutes", 5)
@@ -429,16 +431,16 @@ class AutoBountySystem:
                 reward_amount = settings.get("reward_amount", 100)
                 
                 # Get all servers for this guild
-                servers = await bot.db.game_servers.find({
+                servers = bot.db.game_servers.find({
                     "guild_id": guild_id,
                     "active": True
-                }).to_list(None)
+                }, {"_id": 0, "server_id": 1})
                 
-                for server in servers:
+                async for server in servers:
                     server_id = server["server_id"]
                     
                     # Process auto-bounties for this server (passing bot instance for notifications)
-                    created, skipped = await AutoBountySystem.process_auto_bounties(
+                    jobs.append(AutoBountySystem.process_auto_bounties(
                         bot,  # Pass the full bot instance for Discord notifications
                         guild_id,
                         server_id,
@@ -448,10 +450,24 @@ class AutoBountySystem:
                         repeat_threshold,
                         expiration_hours,
                         reward_amount
-                    )
+                    ))
+            
+            # Servers are independent, process them concurrently with a cap on DB load
+            results = await semaphore_gather(
+                asyncio.Semaphore(AutoBountySystem.MAX_CONCURRENT_SERVERS), jobs
+            )
+            
+            total_created = 0
+            total_skipped = 0
+            
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error processing auto-bounties: {result}")
+                    continue
                     
-                    total_created += created
-                    total_skipped += skipped
+                created, skipped = result
+                total_created += created
+                total_skipped += skipped
             
             logger.info(f"Auto-bounty system run complete: {total_created} bounties created, {total_skipped} skipped")
             
@@ -459,18 +475,24 @@ class AutoBountySystem:
             logger.error(f"Error running auto-bounty system: {e}", exc_info=True)
     
     @staticmethod
-    async def start_auto_bounty_task(bot, interval_minutes: int = 5):
+    def start_auto_bounty_task(bot, interval_minutes: int = 5) -> asyncio.Task:
         """Start the auto-bounty background task
         
         Args:
             bot: Discord bot instance
             interval_minutes: How often to run the auto-bounty system in minutes
-        """
-        while True:
-            try:
-                await AutoBountySystem.run_auto_bounty_system(bot)
-            except Exception as e:
-                logger.error(f"Error in auto-bounty task: {e}")
             
-            # Wait for next interval
-            await asyncio.sleep(interval_minutes * 60)
\ No newline at end of file
+        Returns:
+            asyncio.Task: The running task, cancel it to stop the system
+        """
+        _auto_bounty_loop.change_interval(minutes=interval_minutes)
+        return _auto_bounty_loop.start(bot)
+
+@tasks.loop(minutes=5)
+async def _auto_bounty_loop(bot):
+    """Run the auto-bounty system on a fixed schedule, see start_auto_bounty_task"""
+    # An exception escaping would stop the loop for good
+    try:
+        await AutoBountySystem.run_auto_bounty_system(bot)
+    except Exception as e:
+        logger.error(f"Error in auto-bounty task: {e}")
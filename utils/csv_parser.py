@@ -16,6 +16,9 @@ from typing import Dict, List, Optional, Any, Union, Set, Tuple, BinaryIO, TextI
 
 logger = logging.getLogger(__name__)
 
+# Leading timestamp used to detect the log format
+TIMESTAMP_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+
 class CSVParser:
     """CSV file parser for game log files"""
     
@@ -407,7 +410,7 @@ class CSVParser:
                 parts = first_line.split(";")
                 
                 # Check for timestamp format
-                if re.match(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}", parts[0]):
+                if TIMESTAMP_PATTERN.match(parts[0]):
                     return "deadside"
             
             # Check comma separator (custom)
@@ -416,7 +419,7 @@ class CSVParser:
                 parts = first_line.split(",")
                 
                 # Check for timestamp format
-                if re.match(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}", parts[0]):
+                if TIMESTAMP_PATTERN.match(parts[0]):
                     return "custom"
             
             # Default to deadside
@@ -198,6 +198,8 @@ class DatabaseManager:
         await self._db.players.create_index("server_id")
         await self._db.players.create_index("name")
         await self._db.players.create_index([("server_id", 1), ("name", 1)])
+        # Top rivalries rank a server's players by top prey kills
+        await self._db.players.create_index([("server_id", 1), ("top_prey.kills", -1)])
         
         # Player link indexes
         await self._db.player_links.create_index("link_id", unique=True)
@@ -9,7 +9,7 @@ This module provides decorators for:
 """
 import logging
 import functools
-from typing import Any, Callable, Optional, TypeVar, cast
+from typing import Any, Callable, Optional, Tuple, TypeVar, cast
 
 import discord
 from discord import app_commands
@@ -17,6 +17,7 @@ from discord.ext import commands
 
 from models.guild import Guild
 # from models.user import User (not needed yet)
+from utils.async_utils import AsyncCache
 from utils.embed_builder import EmbedBuilder
 
 logger = logging.getLogger(__name__)
@@ -24,6 +25,39 @@ logger = logging.getLogger(__name__)
 # Type for command callbacks
 T = TypeVar('T')
 
+@AsyncCache.cached(ttl=60)
+async def _get_role_ids(db, guild_id: str) -> Tuple[Optional[int], Optional[int]]:
+    """Get the configured (admin_role_id, mod_role_id) of a guild
+    
+    Permission checks run on every gated command while the roles rarely
+    change, so results are cached briefly. See invalidate_role_cache.
+    
+    Args:
+        db: Database connection
+        guild_id: Discord guild ID
+        
+    Returns:
+        Tuple of admin and mod role IDs (None when not configured)
+    """
+    guild_data = await Guild.get_by_guild_id(db, guild_id)
+    if not guild_data:
+        return None, None
+        
+    admin_role_id = guild_data.admin_role_id
+    # Only present on guilds that configured one
+    mod_role_id = getattr(guild_data, "mod_role_id", None)
+    return (int(admin_role_id) if admin_role_id else None,
+            int(mod_role_id) if mod_role_id else None)
+
+def invalidate_role_cache(db, guild_id: str) -> None:
+    """Drop the cached admin/mod roles of a guild after they change
+    
+    Args:
+        db: Database connection
+        guild_id: Discord guild ID
+    """
+    AsyncCache.invalidate(_get_role_ids, db, guild_id)
+
 def premium_tier_required(tier: int) -> Callable[[T], T]:
     """Decorator that checks if guild has required premium tier
     
@@ -74,18 +108,18 @@ def has_admin_permission() -> Callable[[T], T]:
             if interaction.guild and interaction.guild.owner_id == interaction.user.id:
                 return await func(self, interaction, *args, **kwargs)
                 
+            # Check for administrator permission before going to the database
+            if interaction.user.guild_permissions.administrator:
+                return await func(self, interaction, *args, **kwargs)
+                
             # Check for admin role
-            guild_data = await Guild.get_by_guild_id(str(interaction.guild_id))
-            if guild_data and guild_data.admin_role_id:
+            admin_role_id, _ = await _get_role_ids(self.bot.db, str(interaction.guild_id))
+            if admin_role_id:
                 # Check if user has admin role
                 member = interaction.guild.get_member(interaction.user.id)
-                if member and any(role.id == int(guild_data.admin_role_id) for role in member.roles):
+                if member and member.get_role(admin_role_id):
                     return await func(self, interaction, *args, **kwargs)
                     
-            # Check for administrator permission
-            if interaction.user.guild_permissions.administrator:
-                return await func(self, interaction, *args, **kwargs)
-                
             # User doesn't have permissions
             embed = EmbedBuilder.error(
                 title="Permission Denied",
@@ -114,23 +148,24 @@ def has_mod_permission() -> Callable[[T], T]:
             if interaction.guild and interaction.guild.owner_id == interaction.user.id:
                 return await func(self, interaction, *args, **kwargs)
                 
+            # Check for administrator or manage server permissions before going to the database
+            permissions = interaction.user.guild_permissions
+            if permissions.administrator or permissions.manage_guild:
+                return await func(self, interaction, *args, **kwargs)
+                
             # Check for admin or mod roles
-            guild_data = await Guild.get_by_guild_id(str(interaction.guild_id))
-            if guild_data:
+            admin_role_id, mod_role_id = await _get_role_ids(self.bot.db, str(interaction.guild_id))
+            if admin_role_id or mod_role_id:
                 member = interaction.guild.get_member(interaction.user.id)
                 if member:
                     # Check admin role
-                    if guild_data.admin_role_id and any(role.id == int(guild_data.admin_role_id) for role in member.roles):
+                    if admin_role_id and member.get_role(admin_role_id):
                         return await func(self, interaction, *args, **kwargs)
                         
                     # Check mod role
-                    if guild_data.mod_role_id and any(role.id == int(guild_data.mod_role_id) for role in member.roles):
+                    if mod_role_id and member.get_role(mod_role_id):
                         return await func(self, interaction, *args, **kwargs)
                         
-            # Check for administrator or manage server permissions
-            if interaction.user.guild_permissions.administrator or interaction.user.guild_permissions.manage_guild:
-                return await func(self, interaction, *args, **kwargs)
-                
             # User doesn't have permissions
             embed = EmbedBuilder.error(
                 title="Permission Denied",
@@ -3,13 +3,67 @@ Helper utilities for the Discord bot
 """
 import logging
 import os
+import re
 import asyncio
+import functools
+import time
+import types
+from collections import OrderedDict
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Union, Callable
 import discord
-from discord.ext import commands
 
 logger = logging.getLogger(__name__)
 
+# Premium tier requirements for different features (unknown features need tier 3)
+_FEATURE_TIERS = types.MappingProxyType({
+    'bounties': 2,
+    'rivalries': 1,
+    'factions': 2,
+    'events': 1,
+    'leaderboards': 0,
+    'history': 0,
+    'stats': 0,
+    'kill_feed': 0,
+})
+
+# (unit seconds, suffix) pairs for format_duration, largest first
+_DURATION_UNITS = ((86400, 'd'), (3600, 'h'), (60, 'm'), (1, 's'))
+
+# (unit seconds, name) pairs for format_time_ago, largest first
+_TIME_AGO_UNITS = (
+    (31536000, 'year'),   # 365 days
+    (2592000, 'month'),   # 30 days
+    (604800, 'week'),
+    (86400, 'day'),
+    (3600, 'hour'),
+    (60, 'minute'),
+)
+
+# Role names that grant moderator permission (lowercase)
+_MOD_ROLE_NAMES = frozenset(('mod', 'moderator'))
+
+# Bot display name per guild ID, see get_bot_name / invalidate_bot_name
+_bot_name_cache: Dict[int, str] = {}
+
+# Permission check results keyed by (guild_id, user_id, kind) ->
+# (monotonic timestamp, hash of member role IDs, result), kept in LRU order
+_PERM_CACHE_TTL = 30.0
+_PERM_CACHE_SIZE = 4096
+_perm_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+# Rendered pages kept by a factory-backed PaginationView
+_PAGE_CACHE_SIZE = 8
+
+# A footer that already ends in "Page X/Y", alone or after other text
+_PAGE_FOOTER_RE = re.compile(r'(?:^| • )Page \d+/\d+$')
+
+# Discord allows 2 channel renames per 10 minutes, space voice renames out
+# and only apply the latest requested name (see update_voice_channel_name)
+_VOICE_RENAME_INTERVAL = 300.0
+_voice_renamed_at: Dict[int, float] = {}
+_voice_rename_pending: Dict[int, asyncio.Task] = {}
+
 def is_home_guild_admin(bot, user_id: int) -> bool:
     """Check if a user is an admin of the home guild
     
@@ -48,61 +102,168 @@ def is_home_guild_admin(bot, user_id: int) -> bool:
     # Check if user is an admin
     return member.guild_permissions.administrator or member.id == bot.owner_id
     
-def has_admin_permission(ctx) -> bool:
-    """Check if a user has admin permission in the current guild
+def get_bot_name(bot, guild) -> str:
+    """Get the bot's display name in a guild (nickname if set)
+    
+    The result is cached per guild; call invalidate_bot_name when the bot's
+    member entry changes or the bot leaves the guild.
     
     Args:
-        ctx: Command context
+        bot: Discord bot instance
+        guild: Discord guild
         
     Returns:
-        True if the user has admin permission, False otherwise
+        The bot's nickname in the guild, or its username
     """
+    name = _bot_name_cache.get(guild.id)
+    if name is None:
+        member = guild.get_member(bot.user.id)
+        name = (member.nick if member else None) or bot.user.name
+        _bot_name_cache[guild.id] = name
+    return name
+
+def invalidate_bot_name(guild_id: int) -> None:
+    """Drop the cached bot name for a guild
+    
+    Args:
+        guild_id: Discord guild ID
+    """
+    _bot_name_cache.pop(guild_id, None)
+
+def _ctx_user(ctx):
+    """Get the invoking member from a command context or an interaction"""
+    return getattr(ctx, 'author', None) or ctx.user
+
+def _ctx_bot(ctx):
+    """Get the bot from a command context or an interaction"""
+    return getattr(ctx, 'bot', None) or ctx.client
+
+def invalidate_perm_cache(guild_id: Optional[int], user_id: Optional[int] = None) -> None:
+    """Drop cached permission checks
+    
+    Args:
+        guild_id: Discord guild ID, or None to drop the user's entries in every guild
+        user_id: Discord user ID, or None to drop every entry for the guild
+            (or every entry at all when guild_id is None too)
+    """
+    if guild_id is None:
+        if user_id is None:
+            _perm_cache.clear()
+            return
+        for key in [k for k in _perm_cache if k[1] == user_id]:
+            del _perm_cache[key]
+        return
+        
+    if user_id is not None:
+        for kind in ("admin", "mod"):
+            _perm_cache.pop((guild_id, user_id, kind), None)
+        return
+        
+    for key in [k for k in _perm_cache if k[0] == guild_id]:
+        del _perm_cache[key]
+
+def _cached_permission(kind: str, ctx, check: Callable[[Any], bool]) -> bool:
+    """Run a permission check through the short-lived permission cache
+    
+    Entries are keyed by (guild, user, kind) and are only reused while they
+    are younger than _PERM_CACHE_TTL and the member's role IDs are unchanged.
+    
+    Args:
+        kind: Cache namespace ("admin" or "mod")
+        ctx: Command context or interaction
+        check: Uncached check to run on a miss
+        
+    Returns:
+        Result of the check
+    """
+    if not ctx.guild:
+        return check(ctx)
+        
+    user = _ctx_user(ctx)
+    key = (ctx.guild.id, user.id, kind)
+    roles_hash = hash(tuple(role.id for role in getattr(user, 'roles', ())))
+    now = time.monotonic()
+    
+    entry = _perm_cache.get(key)
+    if entry is not None and now - entry[0] < _PERM_CACHE_TTL and entry[1] == roles_hash:
+        _perm_cache.move_to_end(key)
+        return entry[2]
+        
+    result = check(ctx)
+    _perm_cache[key] = (now, roles_hash, result)
+    _perm_cache.move_to_end(key)
+    if len(_perm_cache) > _PERM_CACHE_SIZE:
+        _perm_cache.popitem(last=False)
+    return result
+
+def _check_admin_permission(ctx) -> bool:
+    """Uncached admin check, see has_admin_permission"""
+    bot = _ctx_bot(ctx)
+    user = _ctx_user(ctx)
+    
     # Check if user is bot owner
-    if ctx.author.id == ctx.bot.owner_id:
+    if user.id == bot.owner_id:
         return True
         
     # Check if user is home guild admin
-    if is_home_guild_admin(ctx.bot, ctx.author.id):
+    if is_home_guild_admin(bot, user.id):
         return True
         
     # Check if user has admin permission in the current guild
-    if ctx.guild and ctx.author.guild_permissions.administrator:
+    if ctx.guild and user.guild_permissions.administrator:
         return True
         
     return False
-    
-def has_mod_permission(ctx) -> bool:
-    """Check if a user has moderator permission in the current guild
-    
-    Args:
-        ctx: Command context
-        
-    Returns:
-        True if the user has moderator permission, False otherwise
-    """
+
+def _check_mod_permission(ctx) -> bool:
+    """Uncached moderator check, see has_mod_permission"""
     # Admin permissions include mod permissions
     if has_admin_permission(ctx):
         return True
         
+    user = _ctx_user(ctx)
+    
     # Check for specific mod permissions
-    if ctx.guild and ctx.author.guild_permissions.manage_messages:
+    if ctx.guild and user.guild_permissions.manage_messages:
         return True
         
     # Check if user has a mod role
     if ctx.guild:
-        # Try to get mod roles from guild settings
-        guild_id = str(ctx.guild.id)
         try:
             # This part would normally query the database for mod roles
             # For now, just check for basic mod role names
-            mod_role_names = ['mod', 'moderator']
-            for role in ctx.author.roles:
-                if role.name.lower() in mod_role_names:
-                    return True
+            if any(role.name.lower() in _MOD_ROLE_NAMES for role in user.roles):
+                return True
         except Exception as e:
             logger.error(f"Error checking mod roles: {e}")
         
     return False
+
+def has_admin_permission(ctx) -> bool:
+    """Check if a user has admin permission in the current guild
+    
+    Results are cached briefly per member, see invalidate_perm_cache.
+    
+    Args:
+        ctx: Command context or interaction
+        
+    Returns:
+        True if the user has admin permission, False otherwise
+    """
+    return _cached_permission("admin", ctx, _check_admin_permission)
+    
+def has_mod_permission(ctx) -> bool:
+    """Check if a user has moderator permission in the current guild
+    
+    Results are cached briefly per member, see invalidate_perm_cache.
+    
+    Args:
+        ctx: Command context or interaction
+        
+    Returns:
+        True if the user has moderator permission, False otherwise
+    """
+    return _cached_permission("mod", ctx, _check_mod_permission)
     
 async def get_guild_premium_tier(db, guild_id: str) -> int:
     """Get premium tier for a guild
@@ -123,30 +284,70 @@ async def get_guild_premium_tier(db, guild_id: str) -> int:
         
     return guild_doc.get("premium_tier", 0)
     
-async def update_voice_channel_name(bot, channel_id: int, name: str) -> bool:
+async def _rename_voice_channel(bot, guild_id: int, channel_id: int, name: str) -> bool:
+    """Rename a voice channel right away, see update_voice_channel_name"""
+    guild = bot.get_guild(guild_id)
+    if guild is None:
+        logger.error(f"Failed to update voice channel name: guild {guild_id} not available")
+        return False
+        
+    # Cache first, only hit the API when the channel isn't cached
+    channel = guild.get_channel(channel_id)
+    try:
+        if channel is None:
+            channel = await guild.fetch_channel(channel_id)
+            
+        # Renaming to the current name would still count against the rate limit
+        if channel.name != name:
+            await channel.edit(name=name)
+            _voice_renamed_at[channel_id] = time.monotonic()
+        return True
+    except discord.HTTPException as e:
+        logger.error(f"Failed to update voice channel name: {e}")
+        return False
+        
+async def _delayed_voice_rename(bot, guild_id: int, channel_id: int, name: str, delay: float) -> None:
+    """Apply a debounced voice channel rename once the rate limit allows it"""
+    await asyncio.sleep(delay)
+    # No longer pending, a newer name must not cancel the edit itself
+    _voice_rename_pending.pop(channel_id, None)
+    # Nobody awaits this task, so log anything the rename raises here
+    try:
+        await _rename_voice_channel(bot, guild_id, channel_id, name)
+    except Exception as e:
+        logger.error(f"Failed to update voice channel name: {e}")
+
+async def update_voice_channel_name(bot, guild_id: int, channel_id: int, name: str) -> bool:
     """Update voice channel name
     
+    Channel renames are heavily rate limited by Discord, so a rename that
+    comes too soon after the previous one is deferred. Only the latest
+    deferred name is applied.
+    
     Args:
         bot: Discord bot instance
+        guild_id: Discord guild ID the channel belongs to
         channel_id: Voice channel ID
         name: New channel name
         
     Returns:
-        True if successful, False otherwise
+        True if the rename was applied or deferred, False otherwise
     """
-    try:
-        channel = bot.get_channel(channel_id)
-        if not channel:
-            channel = await bot.fetch_channel(channel_id)
-            
-        if not channel:
-            return False
+    # A newer name replaces any rename still waiting for its slot
+    pending = _voice_rename_pending.pop(channel_id, None)
+    if pending is not None:
+        pending.cancel()
+        
+    last_rename = _voice_renamed_at.get(channel_id)
+    if last_rename is not None:
+        delay = _VOICE_RENAME_INTERVAL - (time.monotonic() - last_rename)
+        if delay > 0:
+            _voice_rename_pending[channel_id] = asyncio.create_task(
+                _delayed_voice_rename(bot, guild_id, channel_id, name, delay)
+            )
+            return True
             
-        await channel.edit(name=name)
-        return True
-    except Exception as e:
-        logger.error(f"Failed to update voice channel name: {e}")
-        return False
+    return await _rename_voice_channel(bot, guild_id, channel_id, name)
 
 def format_datetime(dt) -> str:
     """Format a datetime object into a string
@@ -160,45 +361,76 @@ def format_datetime(dt) -> str:
     if not dt:
         return "Unknown"
         
-    return dt.strftime("%Y-%m-%d %H:%M:%S UTC")
+    return (f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+            f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d} UTC")
+    
+def _as_utc(dt) -> Optional[datetime]:
+    """Get an aware UTC datetime from a datetime or ISO 8601 string
+    
+    Args:
+        dt: Datetime object or ISO 8601 string (a trailing 'Z' is accepted)
+        
+    Returns:
+        Aware datetime, or None if dt is empty or unparseable
+    """
+    if not dt:
+        return None
+        
+    if isinstance(dt, str):
+        # Python 3.11+ fromisoformat parses the 'Z' suffix natively
+        try:
+            dt = datetime.fromisoformat(dt)
+        except ValueError:
+            return None
+            
+    # Naive datetimes are UTC throughout the bot
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+        
+    return dt
     
 def format_time_ago(dt) -> str:
     """Format a datetime object into a human-readable 'time ago' string
     
     Args:
-        dt: Datetime object
+        dt: Datetime object or ISO 8601 string (a trailing 'Z' is accepted)
         
     Returns:
         Human-readable 'time ago' string (e.g., "5 minutes ago", "2 hours ago")
     """
-    if not dt:
+    dt = _as_utc(dt)
+    if dt is None:
         return "Unknown"
         
-    now = datetime.utcnow()
-    diff = now - dt
+    diff = discord.utils.utcnow() - dt
     
     seconds = diff.total_seconds()
     
-    if seconds < 60:
-        return f"{int(seconds)} seconds ago"
-    elif seconds < 3600:
-        minutes = int(seconds // 60)
-        return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-    elif seconds < 86400:
-        hours = int(seconds // 3600)
-        return f"{hours} hour{'s' if hours != 1 else ''} ago"
-    elif seconds < 604800:  # 7 days
-        days = int(seconds // 86400)
-        return f"{days} day{'s' if days != 1 else ''} ago"
-    elif seconds < 2592000:  # 30 days
-        weeks = int(seconds // 604800)
-        return f"{weeks} week{'s' if weeks != 1 else ''} ago"
-    elif seconds < 31536000:  # 365 days
-        months = int(seconds // 2592000)
-        return f"{months} month{'s' if months != 1 else ''} ago"
-    else:
-        years = int(seconds // 31536000)
-        return f"{years} year{'s' if years != 1 else ''} ago"
+    for size, unit in _TIME_AGO_UNITS:
+        if seconds >= size:
+            count = int(seconds // size)
+            return f"{count} {unit}{'s' if count != 1 else ''} ago"
+            
+    return f"{int(seconds)} seconds ago"
+
+def format_relative_timestamp(dt) -> str:
+    """Format a datetime as a Discord relative timestamp (<t:...:R>)
+    
+    Discord renders it client-side ("5 minutes ago") and keeps it current,
+    but only in message content, embed descriptions and field values. Use
+    format_time_ago for titles, footers and author names.
+    
+    Args:
+        dt: Datetime object or ISO 8601 string (a trailing 'Z' is accepted)
+        
+    Returns:
+        Discord timestamp markup, or "Unknown"
+    """
+    dt = _as_utc(dt)
+    if dt is None:
+        return "Unknown"
+        
+    return discord.utils.format_dt(dt, style="R")
 
 def format_duration(seconds: int) -> str:
     """Format a duration in seconds into a human-readable string
@@ -209,20 +441,13 @@ def format_duration(seconds: int) -> str:
     Returns:
         Formatted duration string
     """
-    if seconds < 60:
-        return f"{seconds}s"
-    elif seconds < 3600:
-        minutes = seconds // 60
-        sec = seconds % 60
-        return f"{minutes}m {sec}s"
-    elif seconds < 86400:
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        return f"{hours}h {minutes}m"
-    else:
-        days = seconds // 86400
-        hours = (seconds % 86400) // 3600
-        return f"{days}d {hours}h"
+    # Largest unit plus the next one down (e.g. "2h 5m")
+    for (size, suffix), (sub_size, sub_suffix) in zip(_DURATION_UNITS, _DURATION_UNITS[1:]):
+        if seconds >= size:
+            major, rem = divmod(seconds, size)
+            return f"{major}{suffix} {rem // sub_size}{sub_suffix}"
+            
+    return f"{seconds}s"
 
 def format_currency(amount: Union[int, float]) -> str:
     """Format a currency amount
@@ -245,9 +470,7 @@ def calculate_kd_ratio(kills: int, deaths: int) -> float:
     Returns:
         K/D ratio (kills / deaths, with deaths=1 if deaths=0)
     """
-    if deaths == 0:
-        deaths = 1
-    return kills / deaths
+    return kills / (deaths or 1)
 
 def is_feature_enabled(guild_doc: Dict[str, Any], feature_name: str) -> bool:
     """Check if a feature is enabled for a guild
@@ -259,66 +482,218 @@ def is_feature_enabled(guild_doc: Dict[str, Any], feature_name: str) -> bool:
     Returns:
         True if the feature is enabled, False otherwise
     """
-    # Premium tier requirements for different features
-    feature_requirements = {
-        'bounties': 2,
-        'rivalries': 1,
-        'factions': 2,
-        'events': 1,
-        'leaderboards': 0,
-        'history': 0,
-        'stats': 0,
-        'kill_feed': 0,
-    }
-    
-    # Get required tier for the feature
-    required_tier = feature_requirements.get(feature_name, 3)
-    
-    # Get guild premium tier (default to 0)
-    guild_tier = guild_doc.get('premium_tier', 0)
-    
-    # Check if the guild meets the required tier
-    return guild_tier >= required_tier
-
-async def paginate_embeds(ctx, embeds: List[discord.Embed], timeout: int = 180):
+    return guild_doc.get('premium_tier', 0) >= _FEATURE_TIERS.get(feature_name, 3)
+
+async def _disable_view(view: discord.ui.View, message: Optional[discord.Message]) -> None:
+    """Disable every item of a view and push the change to its message
+    
+    Args:
+        view: The view to disable
+        message: Message the view is attached to, or None to skip the edit
+    """
+    changed = False
+    for item in view.children:
+        if not item.disabled:
+            item.disabled = True
+            changed = True
+            
+    # Skip the edit when there is nothing new to show
+    if message is None or not changed:
+        return
+        
+    try:
+        await message.edit(view=view)
+    except discord.HTTPException:
+        # Message was deleted or can no longer be edited
+        pass
+
+@functools.lru_cache(maxsize=1024)
+def _page_suffix(page: int, total_pages: int) -> str:
+    """Get the "Page X/Y" label for a zero-based page index"""
+    return f"Page {page + 1}/{total_pages}"
+
+def _add_page_footer(embed: discord.Embed, page: int, total_pages: int) -> None:
+    """Append "Page X/Y" to an embed's footer, keeping its icon
+    
+    Args:
+        embed: Embed to update in place
+        page: Zero-based page index
+        total_pages: Total number of pages
+    """
+    # Embed.footer builds a new proxy object on every access, read it once
+    footer = embed.footer
+    text = footer.text or ""
+    if _PAGE_FOOTER_RE.search(text):
+        return
+        
+    suffix = _page_suffix(page, total_pages)
+    embed.set_footer(
+        text=f"{text} • {suffix}" if text else suffix,
+        icon_url=footer.icon_url
+    )
+
+class PaginationView(discord.ui.View):
+    """Previous/next buttons for paging through a list of embeds
+    
+    Pages come either from a prebuilt list of embeds or, via from_factory,
+    from a callable that renders each page the first time it is shown.
+    """
+    
+    # discord.ui.View keeps an instance __dict__, slots cover our own state
+    __slots__ = ("embeds", "total_pages", "current_page", "message", "_factory", "_page_cache", "_button_states")
+    
+    def __init__(
+        self,
+        embeds: Optional[List[discord.Embed]] = None,
+        timeout: int = 180,
+        factory: Optional[Callable[[int], discord.Embed]] = None,
+        total_pages: Optional[int] = None
+    ):
+        total_pages = len(embeds) if embeds is not None else total_pages
+        if not total_pages or total_pages < 1:
+            raise ValueError("PaginationView needs at least one page")
+            
+        super().__init__(timeout=timeout)
+        self.embeds = embeds
+        self.total_pages = total_pages
+        self.current_page = 0
+        self.message: Optional[discord.Message] = None
+        self._factory = factory
+        self._page_cache: Dict[int, discord.Embed] = {}
+        
+        # Number the pages once up front so page flips never touch footers
+        for page, embed in enumerate(embeds or ()):
+            _add_page_footer(embed, page, self.total_pages)
+            
+        # (previous disabled, next disabled) for each page
+        last_page = self.total_pages - 1
+        self._button_states = [(page == 0, page == last_page) for page in range(self.total_pages)]
+            
+        self._sync_state()
+        
+    @classmethod
+    def from_factory(
+        cls,
+        factory: Callable[[int], discord.Embed],
+        total_pages: int,
+        timeout: int = 180
+    ) -> 'PaginationView':
+        """Create a view that renders pages on demand
+        
+        Args:
+            factory: Callable returning the embed for a zero-based page index
+            total_pages: Number of pages the factory can render
+            timeout: Timeout in seconds for the pagination controls
+            
+        Returns:
+            PaginationView: The lazily rendered view
+            
+        Raises:
+            ValueError: If total_pages is less than 1
+        """
+        return cls(timeout=timeout, factory=factory, total_pages=total_pages)
+        
+    def get_page(self, page: int) -> discord.Embed:
+        """Get the embed for a page, rendering it if needed
+        
+        Args:
+            page: Zero-based page index
+            
+        Returns:
+            discord.Embed: The page embed
+        """
+        if self._factory is None:
+            return self.embeds[page]
+            
+        embed = self._page_cache.get(page)
+        if embed is None:
+            embed = self._factory(page)
+            _add_page_footer(embed, page, self.total_pages)
+            
+            # Keep only the most recently rendered pages (FIFO)
+            if len(self._page_cache) >= _PAGE_CACHE_SIZE:
+                del self._page_cache[next(iter(self._page_cache))]
+            self._page_cache[page] = embed
+            
+        return embed
+        
+    async def on_timeout(self):
+        """Grey out the buttons once they stop responding"""
+        message, self.message = self.message, None
+        await _disable_view(self, message)
+        
+    def _sync_state(self):
+        """Enable/disable the buttons for the current page"""
+        self.previous_button.disabled, self.next_button.disabled = self._button_states[self.current_page]
+        
+    async def _show_page(self, interaction: discord.Interaction, page: int):
+        """Switch to a page and update the message in one edit"""
+        # Ignore double-clicks that were already answered
+        if interaction.response.is_done():
+            return
+            
+        # Nothing changes when already on that page, just acknowledge the click
+        if page == self.current_page:
+            await interaction.response.defer()
+            return
+            
+        self.current_page = page
+        self._sync_state()
+        await interaction.response.edit_message(embed=self.get_page(page), view=self)
+    
+    @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary)
+    async def previous_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show_page(interaction, max(0, self.current_page - 1))
+    
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.primary)
+    async def next_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show_page(interaction, min(self.total_pages - 1, self.current_page + 1))
+
+async def _send(target, ephemeral: bool = False, **kwargs) -> Optional[discord.Message]:
+    """Send a message in reply to a command context or an interaction
+    
+    Args:
+        target: Command context or interaction
+        ephemeral: Whether the message is only visible to the user (interactions only)
+        **kwargs: Arguments passed on to the send call (content, embed, view, ...)
+        
+    Returns:
+        The sent message
+    """
+    if isinstance(target, discord.Interaction):
+        if target.response.is_done():
+            return await target.followup.send(ephemeral=ephemeral, wait=True, **kwargs)
+        # discord.py 2.5+ returns the created message with the callback,
+        # so original_response() (an extra REST GET) is only a fallback
+        callback = await target.response.send_message(ephemeral=ephemeral, **kwargs)
+        resource = getattr(callback, 'resource', None)
+        if isinstance(resource, discord.InteractionMessage):
+            return resource
+        return await target.original_response()
+        
+    # Context.send replies through the interaction for hybrid commands
+    return await target.send(ephemeral=ephemeral, **kwargs)
+
+async def paginate_embeds(ctx, embeds: List[discord.Embed], timeout: int = 180, ephemeral: bool = False):
     """Create a paginated view of embeds
     
     Args:
-        ctx: Command context
+        ctx: Command context or interaction
         embeds: List of embeds to paginate
         timeout: Timeout in seconds for the pagination controls
+        ephemeral: Whether to send the pages ephemerally (interactions only)
     """
     if not embeds:
-        await ctx.send("No data to display.")
+        await _send(ctx, content="No data to display.", ephemeral=ephemeral)
         return
         
     if len(embeds) == 1:
-        await ctx.send(embed=embeds[0])
+        await _send(ctx, embed=embeds[0], ephemeral=ephemeral)
         return
     
-    # Create a simple custom paginator view
-    class PaginationView(discord.ui.View):
-        def __init__(self):
-            super().__init__(timeout=timeout)
-            self.current_page = 0
-            self.embeds = embeds
-        
-        @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary)
-        async def previous_button(self, button, interaction):
-            self.current_page = max(0, self.current_page - 1)
-            await interaction.response.edit_message(embed=self.embeds[self.current_page])
-        
-        @discord.ui.button(label="Next", style=discord.ButtonStyle.primary)
-        async def next_button(self, button, interaction):
-            self.current_page = min(len(self.embeds) - 1, self.current_page + 1)
-            await interaction.response.edit_message(embed=self.embeds[self.current_page])
-    
     # Send the first embed with pagination view
-    view = PaginationView()
-    if hasattr(ctx, 'interaction') and ctx.interaction:
-        await ctx.interaction.response.send_message(embed=embeds[0], view=view)
-    else:
-        await ctx.send(embed=embeds[0], view=view)
+    view = PaginationView(embeds, timeout=timeout)
+    view.message = await _send(ctx, embed=embeds[0], view=view, ephemeral=ephemeral)
 
 def chunk_list(lst: List[Any], chunk_size: int) -> List[List[Any]]:
     """Split a list into chunks of specified size
@@ -411,37 +786,66 @@ async def throttle(coro, max_calls: int, interval: float, key: Optional[Callable
     state["calls"] += 1
     return await coro
     
-async def confirm(ctx, message: str = "Are you sure?", timeout: int = 60, delete_after: bool = True) -> bool:
+class ConfirmView(discord.ui.View):
+    """Yes/No buttons that store the user's choice in ``value``
+    
+    ``value`` is True or False once a button is pressed, None on timeout.
+    """
+    
+    __slots__ = ("value", "message")
+    
+    def __init__(self, timeout: int = 60, confirm_label: str = "Yes", cancel_label: str = "No"):
+        super().__init__(timeout=timeout)
+        self.value = None
+        self.message: Optional[discord.Message] = None
+        self.yes_button.label = confirm_label
+        self.no_button.label = cancel_label
+        
+    async def on_timeout(self):
+        """Grey out the buttons if the prompt is left on screen"""
+        message, self.message = self.message, None
+        await _disable_view(self, message)
+        
+    @discord.ui.button(label="Yes", style=discord.ButtonStyle.green)
+    async def yes_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.value = True
+        self.message = None
+        self.stop()
+        await interaction.response.defer()
+        
+    @discord.ui.button(label="No", style=discord.ButtonStyle.red)
+    async def no_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.value = False
+        self.message = None
+        self.stop()
+        await interaction.response.defer()
+        
+async def confirm(
+    ctx,
+    message: str = "Are you sure?",
+    timeout: int = 60,
+    delete_after: bool = True,
+    ephemeral: bool = False
+) -> bool:
     """Ask for confirmation before proceeding with an action
     
     Args:
-        ctx: Command context
+        ctx: Command context or interaction
         message: Message to show
         timeout: Timeout in seconds
         delete_after: Whether to delete the confirmation message after
+        ephemeral: Whether to send the prompt ephemerally (interactions only)
         
     Returns:
         True if confirmed, False otherwise
     """
-    class ConfirmView(discord.ui.View):
-        def __init__(self):
-            super().__init__(timeout=timeout)
-            self.value = None
-            
-        @discord.ui.button(label="Yes", style=discord.ButtonStyle.green)
-        async def yes_button(self, button, interaction):
-            self.value = True
-            self.stop()
-            
-        @discord.ui.button(label="No", style=discord.ButtonStyle.red)
-        async def no_button(self, button, interaction):
-            self.value = False
-            self.stop()
-            
-    view = ConfirmView()
+    view = ConfirmView(timeout=timeout)
     
     # Send the confirmation message
-    msg = await ctx.send(message, view=view)
+    msg = await _send(ctx, content=message, view=view, ephemeral=ephemeral)
+    if not delete_after:
+        # Only a prompt that stays on screen needs its buttons greyed out on timeout
+        view.message = msg
     
     # Wait for a response
     await view.wait()
@@ -450,7 +854,7 @@ async def confirm(ctx, message: str = "Are you sure?", timeout: int = 60, delete
     if delete_after:
         try:
             await msg.delete()
-        except Exception:
+        except discord.HTTPException:
             pass
     
     return view.value is True
\ No newline at end of file
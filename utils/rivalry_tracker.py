@@ -9,10 +9,22 @@ Each rivalry stores both kill count and a K/D ratio to show dominance level.
 """
 import logging
 from typing import Dict, List, Optional, Tuple, Any
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+
+from pymongo import UpdateOne
 
 logger = logging.getLogger(__name__)
 
+# Player fields read when updating rivalries, the rest of the document is never used.
+# _id stays in so a player without any of these fields is still a non-empty document.
+# The top_* field is read so it is only rewritten when it actually changes.
+_PREY_FIELDS = {"prey": 1, "top_prey": 1}
+_NEMESIS_FIELDS = {"nemesis": 1, "top_nemesis": 1}
+_NAME_FIELDS = {"name": 1}
+
+# Player fields returned by get_player_rivalries
+_PLAYER_RIVALRY_FIELDS = {"prey": 1, "nemesis": 1, "top_prey": 1, "top_nemesis": 1}
+
 class RivalryTracker:
     """Tracks player rivalries based on kill data"""
     
@@ -43,11 +55,17 @@ class RivalryTracker:
                 logger.debug(f"Skipping rivalry update for self-kill: {killer_id}")
                 return True
             
+            updates: List[UpdateOne] = []
+            
             # 1. Update killer's "prey" entry - increment kill count against this victim
-            await RivalryTracker._update_prey_data(db, server_id, killer_id, victim_id)
+            await RivalryTracker._update_prey_data(db, server_id, killer_id, victim_id, updates)
             
             # 2. Update victim's "nemesis" entry - increment deaths by this killer
-            await RivalryTracker._update_nemesis_data(db, server_id, victim_id, killer_id)
+            await RivalryTracker._update_nemesis_data(db, server_id, victim_id, killer_id, updates)
+            
+            # Write both player documents in a single round-trip
+            if updates:
+                await db.players.bulk_write(updates, ordered=False)
             
             return True
             
@@ -56,7 +74,8 @@ class RivalryTracker:
             return False
     
     @staticmethod
-    async def _update_prey_data(db, server_id: str, killer_id: str, victim_id: str) -> bool:
+    async def _update_prey_data(db, server_id: str, killer_id: str, victim_id: str,
+                                updates: List[UpdateOne]) -> bool:
         """Updates a player's "prey" data (player they most frequently kill)
         
         Args:
@@ -64,6 +83,7 @@ class RivalryTracker:
             server_id: Game server ID
             killer_id: Player who did the killing
             victim_id: Player who was killed
+            updates: List the player document update is appended to
             
         Returns:
             True if updated successfully, False otherwise
@@ -73,7 +93,7 @@ class RivalryTracker:
             killer_doc = await db.players.find_one({
                 "server_id": server_id, 
                 "player_id": killer_id
-            })
+            }, _PREY_FIELDS)
             
             if not killer_doc:
                 logger.warning(f"Cannot update prey: Killer {killer_id} not found in database")
@@ -83,11 +103,12 @@ class RivalryTracker:
             victim_doc = await db.players.find_one({
                 "server_id": server_id, 
                 "player_id": victim_id
-            })
+            }, {**_NAME_FIELDS, f"nemesis.{killer_id}": 1})
             
             # Initialize prey data if it doesn't exist
             if 'prey' not in killer_doc:
                 killer_doc['prey'] = {}
+            previous_top_prey = killer_doc.get('top_prey')
             
             # Initialize or update this victim in prey data
             if victim_id not in killer_doc['prey']:
@@ -95,11 +116,11 @@ class RivalryTracker:
                     'kills': 1,
                     'player_id': victim_id,
                     'player_name': victim_doc['name'] if victim_doc else "Unknown Player",
-                    'last_kill': datetime.utcnow()
+                    'last_kill': datetime.now(timezone.utc)
                 }
             else:
                 killer_doc['prey'][victim_id]['kills'] += 1
-                killer_doc['prey'][victim_id]['last_kill'] = datetime.utcnow()
+                killer_doc['prey'][victim_id]['last_kill'] = datetime.now(timezone.utc)
                 if victim_doc:
                     killer_doc['prey'][victim_id]['player_name'] = victim_doc['name']
             
@@ -114,30 +135,32 @@ class RivalryTracker:
                 killer_doc['prey'][victim_id]['kd_ratio'] = round(kd_ratio, 2)
             
             # Update top_prey field for easy access
-            prey_list = sorted(
-                [(v['kills'], v['player_id'], v.get('kd_ratio', 0.0)) for k, v in killer_doc['prey'].items()],
-                key=lambda x: (x[0], x[2]),  # Sort by kills, then K/D as tiebreaker
-                reverse=True
+            # Single pass for the entry with the most kills, K/D as tiebreaker
+            top_prey = max(
+                killer_doc['prey'].values(),
+                key=lambda v: (v['kills'], v.get('kd_ratio', 0.0)),
+                default=None
             )
             
-            if prey_list:
-                top_prey_id = prey_list[0][1]
+            if top_prey:
                 # Store top prey information for easy access
                 killer_doc['top_prey'] = {
-                    'player_id': top_prey_id,
-                    'player_name': killer_doc['prey'][top_prey_id]['player_name'],
-                    'kills': killer_doc['prey'][top_prey_id]['kills'],
-                    'kd_ratio': killer_doc['prey'][top_prey_id].get('kd_ratio', 0.0)
+                    'player_id': top_prey['player_id'],
+                    'player_name': top_prey['player_name'],
+                    'kills': top_prey['kills'],
+                    'kd_ratio': top_prey.get('kd_ratio', 0.0)
                 }
             
-            # Update the player document
-            await db.players.update_one(
+            # Queue the player document update, writing only the prey entry
+            # that changed and top_prey when it differs from before
+            changes = {f"prey.{victim_id}": killer_doc['prey'][victim_id]}
+            if killer_doc.get('top_prey') != previous_top_prey:
+                changes["top_prey"] = killer_doc['top_prey']
+                
+            updates.append(UpdateOne(
                 {"server_id": server_id, "player_id": killer_id},
-                {"$set": {
-                    "prey": killer_doc['prey'],
-                    "top_prey": killer_doc.get('top_prey')
-                }}
-            )
+                {"$set": changes}
+            ))
             
             return True
             
@@ -146,7 +169,8 @@ class RivalryTracker:
             return False
     
     @staticmethod
-    async def _update_nemesis_data(db, server_id: str, victim_id: str, killer_id: str) -> bool:
+    async def _update_nemesis_data(db, server_id: str, victim_id: str, killer_id: str,
+                                   updates: List[UpdateOne]) -> bool:
         """Updates a player's "nemesis" data (player they're most frequently killed by)
         
         Args:
@@ -154,6 +178,7 @@ class RivalryTracker:
             server_id: Game server ID
             victim_id: Player who was killed
             killer_id: Player who did the killing
+            updates: List the player document update is appended to
             
         Returns:
             True if updated successfully, False otherwise
@@ -163,7 +188,7 @@ class RivalryTracker:
             victim_doc = await db.players.find_one({
                 "server_id": server_id, 
                 "player_id": victim_id
-            })
+            }, {**_NEMESIS_FIELDS, f"prey.{killer_id}": 1})
             
             if not victim_doc:
                 logger.warning(f"Cannot update nemesis: Victim {victim_id} not found in database")
@@ -173,11 +198,12 @@ class RivalryTracker:
             killer_doc = await db.players.find_one({
                 "server_id": server_id, 
                 "player_id": killer_id
-            })
+            }, _NAME_FIELDS)
             
             # Initialize nemesis data if it doesn't exist
             if 'nemesis' not in victim_doc:
                 victim_doc['nemesis'] = {}
+            previous_top_nemesis = victim_doc.get('top_nemesis')
             
             # Initialize or update this killer in nemesis data
             if killer_id not in victim_doc['nemesis']:
@@ -185,11 +211,11 @@ class RivalryTracker:
                     'kills': 1,
                     'player_id': killer_id,
                     'player_name': killer_doc['name'] if killer_doc else "Unknown Player",
-                    'last_kill': datetime.utcnow()
+                    'last_kill': datetime.now(timezone.utc)
                 }
             else:
                 victim_doc['nemesis'][killer_id]['kills'] += 1
-                victim_doc['nemesis'][killer_id]['last_kill'] = datetime.utcnow()
+                victim_doc['nemesis'][killer_id]['last_kill'] = datetime.now(timezone.utc)
                 if killer_doc:
                     victim_doc['nemesis'][killer_id]['player_name'] = killer_doc['name']
             
@@ -205,30 +231,32 @@ class RivalryTracker:
                 victim_doc['nemesis'][killer_id]['kd_ratio'] = round(kd_ratio, 2)
             
             # Update top_nemesis field for easy access
-            nemesis_list = sorted(
-                [(v['kills'], v['player_id'], v.get('kd_ratio', 0.0)) for k, v in victim_doc['nemesis'].items()],
-                key=lambda x: (x[0], x[2]),  # Sort by kills, then K/D as tiebreaker
-                reverse=True
+            # Single pass for the entry with the most kills, K/D as tiebreaker
+            top_nemesis = max(
+                victim_doc['nemesis'].values(),
+                key=lambda v: (v['kills'], v.get('kd_ratio', 0.0)),
+                default=None
             )
             
-            if nemesis_list:
-                top_nemesis_id = nemesis_list[0][1]
+            if top_nemesis:
                 # Store top nemesis information for easy access
                 victim_doc['top_nemesis'] = {
-                    'player_id': top_nemesis_id,
-                    'player_name': victim_doc['nemesis'][top_nemesis_id]['player_name'],
-                    'kills': victim_doc['nemesis'][top_nemesis_id]['kills'],
-                    'kd_ratio': victim_doc['nemesis'][top_nemesis_id].get('kd_ratio', 0.0)
+                    'player_id': top_nemesis['player_id'],
+                    'player_name': top_nemesis['player_name'],
+                    'kills': top_nemesis['kills'],
+                    'kd_ratio': top_nemesis.get('kd_ratio', 0.0)
                 }
             
-            # Update the player document
-            await db.players.update_one(
+            # Queue the player document update, writing only the nemesis entry
+            # that changed and top_nemesis when it differs from before
+            changes = {f"nemesis.{killer_id}": victim_doc['nemesis'][killer_id]}
+            if victim_doc.get('top_nemesis') != previous_top_nemesis:
+                changes["top_nemesis"] = victim_doc['top_nemesis']
+                
+            updates.append(UpdateOne(
                 {"server_id": server_id, "player_id": victim_id},
-                {"$set": {
-                    "nemesis": victim_doc['nemesis'],
-                    "top_nemesis": victim_doc.get('top_nemesis')
-                }}
-            )
+                {"$set": changes}
+            ))
             
             return True
             
@@ -251,7 +279,7 @@ class RivalryTracker:
         player_doc = await db.players.find_one({
             "server_id": server_id,
             "player_id": player_id
-        })
+        }, _PLAYER_RIVALRY_FIELDS)
         
         if not player_doc:
             return {
@@ -280,37 +308,32 @@ class RivalryTracker:
         Returns:
             Dictionary containing top rivalries with "hunter" and "hunted" designations
         """
-        # Find players with rivalries
-        cursor = db.players.find({
-            "server_id": server_id,
-            "top_prey": {"$exists": True}
-        })
-        
-        rivalries = []
-        
-        async for player in cursor:
-            if "top_prey" in player and player["top_prey"]:
-                prey_id = player["top_prey"]["player_id"]
-                prey_kills = player["top_prey"]["kills"]
-                prey_kd = player["top_prey"].get("kd_ratio", 0.0)
-                
-                # Only include significant rivalries (more than 3 kills)
-                if prey_kills >= 3:
-                    rivalries.append({
-                        "hunter_id": player["player_id"],
-                        "hunter_name": player["name"],
-                        "hunted_id": prey_id,
-                        "hunted_name": player["top_prey"]["player_name"],
-                        "kill_count": prey_kills,
-                        "kd_ratio": prey_kd,
-                        "intensity": prey_kills * prey_kd  # Composite score of kills * K/D
-                    })
+        # Let the database pick, score and rank the significant rivalries
+        # (more than 3 kills) so only the final rows come over the wire
+        pipeline = [
+            {"$match": {
+                "server_id": server_id,
+                "top_prey.kills": {"$gte": 3}
+            }},
+            {"$project": {
+                "_id": 0,
+                "hunter_id": "$player_id",
+                "hunter_name": "$name",
+                "hunted_id": "$top_prey.player_id",
+                "hunted_name": "$top_prey.player_name",
+                "kill_count": "$top_prey.kills",
+                "kd_ratio": {"$ifNull": ["$top_prey.kd_ratio", 0.0]}
+            }},
+            # Composite score of kills * K/D
+            {"$addFields": {"intensity": {"$multiply": ["$kill_count", "$kd_ratio"]}}},
+            {"$sort": {"intensity": -1}},
+            {"$limit": limit}
+        ]
         
-        # Sort by intensity (kills * K/D)
-        rivalries.sort(key=lambda x: x["intensity"], reverse=True)
+        rivalries = await db.players.aggregate(pipeline).to_list(length=limit)
         
         return {
-            "top_rivalries": rivalries[:limit]
+            "top_rivalries": rivalries
         }
     
     @staticmethod
@@ -329,7 +352,7 @@ class RivalryTracker:
         # Get all kills for this server
         kill_cursor = db.kills.find({
             "server_id": server_id
-        }).sort("timestamp", 1)  # Process in chronological order
+        }, {"_id": 0, "killer_id": 1, "victim_id": 1, "server_id": 1}).sort("timestamp", 1)  # Process in chronological order
         
         processed_count = 0
         
@@ -4,21 +4,65 @@ SFTP connection handler for Tower of Temptation PvP Statistics Bot
 This module provides utilities for connecting to game servers via SFTP 
 and retrieving log files.
 """
-import os
+import posixpath
+import platform
+import functools
 import logging
 import asyncio
 import re
-import io
-from typing import List, Dict, Any, Optional, Tuple, Union, BinaryIO
+from typing import List, Dict, Any, Optional, Tuple, Union, BinaryIO, AsyncIterator
 from datetime import datetime, timedelta
-import paramiko
 import asyncssh
 
+from utils.async_utils import AsyncCache
+
 logger = logging.getLogger(__name__)
 
+# Seconds between SSH keepalives used to detect dropped connections
+KEEPALIVE_INTERVAL = 30
+
+# asyncssh offers ChaCha20 first; on x86 AES-GCM runs on AES-NI and is faster,
+# so move it to the front there ('^' keeps the remaining defaults after it)
+ENCRYPTION_ALGS = (
+    '^aes128-gcm@openssh.com,aes256-gcm@openssh.com'
+    if platform.machine().lower() in ('x86_64', 'amd64')
+    else 'default'
+)
+
+# CSV log filenames
+CSV_FILE_PATTERN = re.compile(r'\.csv$')
+
+# Date embedded in log filenames, e.g. 2024.05.01 or 2024-05-01
+FILENAME_DATE_PATTERN = re.compile(r'(\d{4}[.-]\d{2}[.-]\d{2})')
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a filename pattern once and reuse it across calls"""
+    return re.compile(pattern)
+
+
+class _IncompleteWalk(Exception):
+    """Raised by a directory walk in which some listing failed
+    
+    Carries the files that were found so the caller can still use them while
+    keeping the partial result out of the cache.
+    """
+    
+    def __init__(self, files: Tuple[str, ...]):
+        super().__init__(f"{len(files)} files found before a listing failed")
+        self.files = files
+
+
 class SFTPClient:
     """SFTP client for game servers"""
     
+    __slots__ = (
+        "hostname", "port", "username", "password", "timeout", "max_retries",
+        "_sftp_client", "_ssh_client", "_connected", "_connection_attempts",
+        "_dir_semaphore", "_connect_task"
+    )
+    
     def __init__(
         self,
         hostname: str,
@@ -26,7 +70,8 @@ class SFTPClient:
         username: str,
         password: str,
         timeout: int = 30,
-        max_retries: int = 3
+        max_retries: int = 3,
+        max_concurrent_dirs: int = 8
     ):
         """Initialize SFTP handler
         
@@ -37,6 +82,7 @@ class SFTPClient:
             password: SFTP password
             timeout: Connection timeout in seconds
             max_retries: Maximum number of connection retries
+            max_concurrent_dirs: Maximum directories listed at the same time
         """
         self.hostname = hostname
         self.port = port
@@ -48,6 +94,8 @@ class SFTPClient:
         self._ssh_client = None
         self._connected = False
         self._connection_attempts = 0
+        self._dir_semaphore = asyncio.Semaphore(max_concurrent_dirs)
+        self._connect_task: Optional[asyncio.Future] = None
         
     async def connect(self) -> bool:
         """Connect to SFTP server
@@ -55,9 +103,28 @@ class SFTPClient:
         Returns:
             True if connected successfully, False otherwise
         """
-        if self._connected and self._sftp_client:
+        if self._is_alive():
             return True
             
+        # Concurrent callers share one in-flight attempt (including its
+        # retries) instead of each running their own
+        if self._connect_task is None:
+            self._connect_task = asyncio.ensure_future(self._connect())
+            self._connect_task.add_done_callback(self._clear_connect_task)
+            
+        return await asyncio.shield(self._connect_task)
+    
+    def _clear_connect_task(self, task: asyncio.Future):
+        """Forget a finished connection attempt so the next call can retry"""
+        if self._connect_task is task:
+            self._connect_task = None
+    
+    async def _connect(self) -> bool:
+        """Open the SSH and SFTP sessions, retrying with backoff
+        
+        Returns:
+            True if connected successfully, False otherwise
+        """
         try:
             # Create asyncssh connection
             self._ssh_client = await asyncssh.connect(
@@ -66,7 +133,11 @@ class SFTPClient:
                 username=self.username,
                 password=self.password,
                 known_hosts=None,  # Disable known hosts check
-                connect_timeout=self.timeout
+                connect_timeout=self.timeout,
+                # Let asyncssh detect dead connections in the background
+                # instead of probing before each operation
+                keepalive_interval=KEEPALIVE_INTERVAL,
+                encryption_algs=ENCRYPTION_ALGS
             )
             
             # Get SFTP client
@@ -93,7 +164,7 @@ class SFTPClient:
             logger.info(f"Retrying connection in {delay} seconds...")
             await asyncio.sleep(delay)
             
-            return await self.connect()
+            return await self._connect()
     
     async def disconnect(self):
         """Disconnect from SFTP server"""
@@ -106,11 +177,21 @@ class SFTPClient:
             self._ssh_client = None
             
         self._connected = False
+        AsyncCache.invalidate_pattern(SFTPClient._find_files, [self])
         logger.info("Disconnected from SFTP server")
     
+    def _is_alive(self) -> bool:
+        """Check the session without a network round-trip"""
+        return (
+            self._connected
+            and self._sftp_client is not None
+            and self._ssh_client is not None
+            and not self._ssh_client.is_closed()
+        )
+    
     async def ensure_connected(self):
         """Ensure connection to SFTP server"""
-        if not self._connected or not self._sftp_client or not self._ssh_client:
+        if not self._is_alive():
             await self.connect()
     
     async def list_directory(self, directory: str) -> List[str]:
@@ -175,13 +256,10 @@ class SFTPClient:
                 logger.info(f"Downloaded {remote_path} to {local_path}")
                 return None
             else:
-                # Download to memory
-                file_obj = io.BytesIO()
-                await self._sftp_client.getfo(remote_path, file_obj)
-                
-                # Reset position to beginning
-                file_obj.seek(0)
-                content = file_obj.read()
+                # Download to memory; a full read is pipelined by asyncssh
+                # and returns a single buffer without an intermediate copy
+                async with self._sftp_client.open(remote_path, 'rb') as f:
+                    content = await f.read()
                 
                 logger.info(f"Downloaded {remote_path} to memory ({len(content)} bytes)")
                 return content
@@ -190,6 +268,28 @@ class SFTPClient:
             logger.error(f"Failed to download file {remote_path}: {e}")
             return None
             
+    async def iter_file_chunks(self, remote_path: str, chunk_size: int = 1024 * 1024) -> AsyncIterator[bytes]:
+        """Stream a remote file without holding all of it in memory
+        
+        Each chunk is fetched as several pipelined block reads, so chunk_size
+        should stay well above the SFTP block size (typically 16-256 KiB).
+        
+        Args:
+            remote_path: Remote file path
+            chunk_size: Chunk size in bytes
+            
+        Yields:
+            Successive chunks of the file
+        """
+        await self.ensure_connected()
+        
+        async with self._sftp_client.open(remote_path, 'rb') as f:
+            while True:
+                chunk = await f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+            
     async def read_file_by_chunks(self, remote_path: str, chunk_size: int = 4096) -> Optional[List[bytes]]:
         """Read file by chunks
         
@@ -203,13 +303,12 @@ class SFTPClient:
         await self.ensure_connected()
         
         try:
-            chunks = []
+            # Read the whole file as one pipelined request stream rather than
+            # one round-trip per chunk, then split it locally
             async with self._sftp_client.open(remote_path, 'rb') as f:
-                while True:
-                    chunk = await f.read(chunk_size)
-                    if not chunk:
-                        break
-                    chunks.append(chunk)
+                data = await f.read()
+                
+            chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
                     
             logger.info(f"Read {remote_path} by chunks ({len(chunks)} chunks)")
             return chunks
@@ -218,65 +317,152 @@ class SFTPClient:
             logger.error(f"Failed to read file {remote_path} by chunks: {e}")
             return None
             
-    async def find_files_by_pattern(self, directory: str, pattern: str, recursive: bool = False, max_depth: int = 5) -> List[str]:
+    async def find_files_by_pattern(self, directory: str, pattern: Union[str, re.Pattern], recursive: bool = False, max_depth: int = 5) -> List[str]:
         """Find files by pattern
         
         Args:
             directory: Directory to search
-            pattern: Regular expression pattern for filenames
+            pattern: Regular expression pattern (or compiled pattern) for filenames
             recursive: Whether to search recursively
             max_depth: Maximum recursion depth
             
         Returns:
             List of matching file paths
         """
-        await self.ensure_connected()
+        try:
+            files = await self._find_files(directory, pattern, recursive, max_depth)
+        except _IncompleteWalk as e:
+            # Use what was found, but the next call walks again
+            files = e.files
+            
+        return list(files)
         
-        result = []
-        pattern_re = re.compile(pattern)
+    @AsyncCache.cached(ttl=15)
+    async def _find_files(self, directory: str, pattern: Union[str, re.Pattern], recursive: bool, max_depth: int) -> Tuple[str, ...]:
+        """Walk a directory for matching files, cached briefly
         
-        await self._find_files_recursive(directory, pattern_re, result, recursive, max_depth, 0)
+        Only complete walks are cached; a failed listing raises _IncompleteWalk.
         
-        return result
+        Args:
+            directory: Directory to search
+            pattern: Regular expression pattern (or compiled pattern) for filenames
+            recursive: Whether to search recursively
+            max_depth: Maximum recursion depth
+            
+        Returns:
+            Tuple of matching file paths
+        """
+        await self.ensure_connected()
+        
+        pattern_re = _compile_pattern(pattern) if isinstance(pattern, str) else pattern
+        # Hold on to one session for the whole walk, even if the client
+        # reconnects or disconnects part way through
+        sftp = self._sftp_client
+        if sftp is None:
+            logger.error(f"Failed to list directory {directory}: not connected")
+            raise _IncompleteWalk(())
+        
+        # Each directory starts listing its subdirectories as soon as its own
+        # listing returns, without waiting for the rest of its level; the
+        # semaphore bounds how many listings are in flight
+        failed = []
+        files = await self._walk_directory(sftp, directory, pattern_re, recursive, max_depth, 0, failed)
+        if failed:
+            raise _IncompleteWalk(tuple(files))
+            
+        return tuple(files)
         
-    async def _find_files_recursive(self, directory: str, pattern_re: re.Pattern, result: List[str], recursive: bool, max_depth: int, current_depth: int):
-        """Recursively find files by pattern
+    async def _walk_directory(
+        self,
+        sftp: asyncssh.SFTPClient,
+        directory: str,
+        pattern_re: re.Pattern,
+        recursive: bool,
+        max_depth: int,
+        depth: int,
+        failed: List[str]
+    ) -> List[str]:
+        """Find matching files in a directory and, concurrently, its subdirectories
         
         Args:
+            sftp: SFTP session to list with
             directory: Directory to search
             pattern_re: Compiled regular expression pattern
-            result: List to add results to
             recursive: Whether to search recursively
             max_depth: Maximum recursion depth
-            current_depth: Current recursion depth
+            depth: Depth of this directory
+            failed: Collects directories whose listing failed
+            
+        Returns:
+            List of matching file paths
         """
-        if current_depth > max_depth:
-            return
+        async with self._dir_semaphore:
+            files, subdirs = await self._scan_directory(
+                sftp, directory, pattern_re, recursive and depth < max_depth, failed
+            )
+        
+        if subdirs:
+            nested = await asyncio.gather(*(
+                self._walk_directory(sftp, d, pattern_re, recursive, max_depth, depth + 1, failed)
+                for d in subdirs
+            ))
+            for sub_files in nested:
+                files.extend(sub_files)
+        
+        return files
+        
+    async def _scan_directory(
+        self,
+        sftp: asyncssh.SFTPClient,
+        directory: str,
+        pattern_re: re.Pattern,
+        include_dirs: bool,
+        failed: List[str]
+    ) -> Tuple[List[str], List[str]]:
+        """List a single directory for matching files and subdirectories
+        
+        Args:
+            sftp: SFTP session to list with
+            directory: Directory to list
+            pattern_re: Compiled regular expression pattern
+            include_dirs: Whether to return subdirectories for further scanning
+            failed: Collects this directory if its listing fails
             
+        Returns:
+            Tuple of (matching file paths, subdirectory paths)
+        """
+        files = []
+        subdirs = []
+        
         try:
-            entries = await self._sftp_client.listdir(directory)
-            
-            for entry in entries:
-                entry_path = f"{directory}/{entry}"
-                
-                try:
-                    entry_info = await self.get_file_info(entry_path)
+            async for entry in sftp.scandir(directory):
+                name = entry.filename
+                if name in ('.', '..'):
+                    continue
                     
-                    if not entry_info:
+                entry_path = posixpath.join(directory, name)
+                entry_type = entry.attrs.type
+
+                # Listing attributes describe a symlink itself, and some
+                # servers leave the type out; stat those to follow the link
+                if entry_type in (asyncssh.FILEXFER_TYPE_SYMLINK, asyncssh.FILEXFER_TYPE_UNKNOWN):
+                    try:
+                        entry_type = (await sftp.stat(entry_path)).type
+                    except Exception as e:
+                        logger.warning(f"Error processing entry {entry_path}: {e}")
                         continue
-                        
-                    if entry_info["is_file"] and pattern_re.search(entry):
-                        result.append(entry_path)
-                        
-                    elif entry_info["is_dir"] and recursive:
-                        await self._find_files_recursive(entry_path, pattern_re, result, recursive, max_depth, current_depth + 1)
-                        
-                except Exception as e:
-                    logger.warning(f"Error processing entry {entry_path}: {e}")
-                    continue
+
+                if entry_type == asyncssh.FILEXFER_TYPE_REGULAR:
+                    if pattern_re.search(name):
+                        files.append(entry_path)
+                elif entry_type == asyncssh.FILEXFER_TYPE_DIRECTORY and include_dirs:
+                    subdirs.append(entry_path)
                     
         except Exception as e:
             logger.error(f"Failed to list directory {directory}: {e}")
+            failed.append(directory)
+            
+        return files, subdirs
             
     async def find_csv_files(
         self, 
@@ -297,7 +483,7 @@ class SFTPClient:
             List of CSV file paths
         """
         # Find all CSV files
-        csv_files = await self.find_files_by_pattern(directory, r'\.csv$', recursive, max_depth)
+        csv_files = await self.find_files_by_pattern(directory, CSV_FILE_PATTERN, recursive, max_depth)
         
         # Filter by date range if provided
         if date_range:
@@ -306,8 +492,8 @@ class SFTPClient:
             
             for file_path in csv_files:
                 # Extract date from filename using common patterns
-                file_name = os.path.basename(file_path)
-                date_match = re.search(r'(\d{4}[.-]\d{2}[.-]\d{2})', file_name)
+                file_name = posixpath.basename(file_path)
+                date_match = FILENAME_DATE_PATTERN.search(file_name)
                 
                 if date_match:
                     date_str = date_match.group(1)